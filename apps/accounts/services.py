@@ -371,7 +371,7 @@ class ExportService:
             "expired": "Vencido",
         }
 
-        for enrollment in enrollments:
+        for enrollment in enrollments.iterator(chunk_size=500):
             ws.append(
                 [
                     enrollment.user.first_name,
@@ -5,3 +5,6 @@ class LessonsLearnedConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.lessons_learned"
     verbose_name = "Lecciones Aprendidas"
+
+    def ready(self):
+        import apps.lessons_learned.signals  # noqa: F401
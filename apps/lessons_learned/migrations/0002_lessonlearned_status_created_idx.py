@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lessons_learned", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="lessonlearned",
+            index=models.Index(
+                fields=["status", "-created_at", "-id"], name="lessons_lea_status_9825b6_idx"
+            ),
+        ),
+    ]
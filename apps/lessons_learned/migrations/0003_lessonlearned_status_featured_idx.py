@@ -0,0 +1,20 @@
+# Generated by Django 5.1.15 on 2026-10-16 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lessons_learned", "0002_lessonlearned_status_created_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="lessonlearned",
+            index=models.Index(
+                fields=["status", "is_featured", "-created_at"],
+                name="lessons_lea_status_c62491_idx",
+            ),
+        ),
+    ]
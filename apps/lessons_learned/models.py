@@ -157,6 +157,10 @@ class LessonLearned(models.Model):
         verbose_name = _("Lección aprendida")
         verbose_name_plural = _("Lecciones aprendidas")
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "-created_at", "-id"]),
+            models.Index(fields=["status", "is_featured", "-created_at"]),
+        ]
 
     def __str__(self):
         return self.title
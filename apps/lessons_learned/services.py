@@ -3,10 +3,13 @@ Business logic services for lessons learned.
 """
 
 import logging
+from collections import defaultdict
 
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models import F, Q
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 
 from apps.lessons_learned.models import (
     Category,
@@ -17,6 +20,10 @@ from apps.lessons_learned.models import (
 
 logger = logging.getLogger(__name__)
 
+ACTIVE_CATEGORIES_CACHE_KEY = "lessons_learned:active_categories"
+LESSON_STATS_CACHE_KEY = "lesson_stats:{}"
+LESSON_STATS_CACHE_TIMEOUT = 600
+
 
 class LessonLearnedService:
     """Service for lessons learned operations."""
@@ -64,7 +71,7 @@ class LessonLearnedService:
         if submit_for_review:
             LessonLearnedService.submit_for_review(lesson_learned)
 
-        logger.info(f"Lesson learned created: {lesson_learned.id}")
+        logger.info("Lesson learned created: %s", lesson_learned.id)
         return lesson_learned
 
     @staticmethod
@@ -109,7 +116,7 @@ class LessonLearnedService:
 
         lesson.save()
 
-        logger.info(f"Lesson learned updated: {lesson.id}")
+        logger.info("Lesson learned updated: %s", lesson.id)
         return lesson
 
     @staticmethod
@@ -123,7 +130,7 @@ class LessonLearnedService:
         lesson_learned.status = LessonLearned.Status.PENDING_REVIEW
         lesson_learned.save()
 
-        logger.info(f"Lesson submitted for review: {lesson_learned.id}")
+        logger.info("Lesson submitted for review: %s", lesson_learned.id)
         return lesson_learned
 
     @staticmethod
@@ -145,11 +152,10 @@ class LessonLearnedService:
         lesson_learned.review_notes = notes
         lesson_learned.save()
 
-        logger.info(f"Lesson approved: {lesson_learned.id} by {reviewer.id}")
+        logger.info("Lesson approved: %s by %s", lesson_learned.id, reviewer.id)
         return lesson_learned
 
     @staticmethod
-    @transaction.atomic
     def reject_lesson(
         lesson_learned: LessonLearned,
         reviewer,
@@ -170,7 +176,7 @@ class LessonLearnedService:
         lesson_learned.review_notes = reason
         lesson_learned.save()
 
-        logger.info(f"Lesson rejected: {lesson_learned.id} by {reviewer.id}")
+        logger.info("Lesson rejected: %s by %s", lesson_learned.id, reviewer.id)
         return lesson_learned
 
     @staticmethod
@@ -181,7 +187,7 @@ class LessonLearnedService:
         lesson_learned.status = LessonLearned.Status.ARCHIVED
         lesson_learned.save()
 
-        logger.info(f"Lesson archived: {lesson_learned.id}")
+        logger.info("Lesson archived: %s", lesson_learned.id)
         return lesson_learned
 
     @staticmethod
@@ -244,6 +250,41 @@ class LessonLearnedService:
 
         return queryset
 
+    @staticmethod
+    def paginate_by_cursor(queryset, cursor: str = None, page_size: int = 12):
+        """
+        Keyset-paginate lessons ordered by (created_at DESC, id DESC).
+
+        ``cursor`` has the form ``<created_at isoformat>:<id>`` and points at
+        the last lesson of the previous page. Returns the page as a list and
+        the cursor for the next page, or None when there are no more lessons.
+        Raises ValueError when the cursor cannot be parsed.
+        """
+        queryset = queryset.order_by("-created_at", "-id")
+
+        if cursor:
+            created_at, _, last_id = cursor.rpartition(":")
+            try:
+                timestamp = parse_datetime(created_at)
+            except ValueError:
+                timestamp = None
+            if timestamp is None or not last_id.isdigit():
+                raise ValueError("Cursor de paginación inválido")
+
+            queryset = queryset.filter(
+                Q(created_at__lt=timestamp) | Q(created_at=timestamp, id__lt=int(last_id))
+            )
+
+        lessons = list(queryset[: page_size + 1])
+
+        next_cursor = None
+        if len(lessons) > page_size:
+            lessons = lessons[:page_size]
+            last = lessons[-1]
+            next_cursor = f"{last.created_at.isoformat()}:{last.id}"
+
+        return lessons, next_cursor
+
     @staticmethod
     def get_pending_reviews():
         """
@@ -285,7 +326,29 @@ class LessonLearnedService:
     def get_lessons_statistics(category: Category = None) -> dict:
         """
         Get statistics for lessons learned.
+
+        Results are cached per category for LESSON_STATS_CACHE_TIMEOUT
+        seconds and dropped whenever a lesson is saved or deleted.
         """
+        cache_key = LESSON_STATS_CACHE_KEY.format(category.id if category else "all")
+        return cache.get_or_set(
+            cache_key,
+            lambda: LessonLearnedService._compute_lessons_statistics(category),
+            timeout=LESSON_STATS_CACHE_TIMEOUT,
+        )
+
+    @staticmethod
+    def invalidate_lessons_statistics(category_id=None) -> None:
+        """
+        Drop cached statistics for all lessons and for the given category.
+        """
+        keys = [LESSON_STATS_CACHE_KEY.format("all")]
+        if category_id:
+            keys.append(LESSON_STATS_CACHE_KEY.format(category_id))
+        cache.delete_many(keys)
+
+    @staticmethod
+    def _compute_lessons_statistics(category: Category = None) -> dict:
         from django.db.models import Avg, Count, Sum
 
         queryset = LessonLearned.objects.all()
@@ -327,16 +390,42 @@ class LessonAttachmentService:
         """
         Add an attachment to a lesson learned.
         """
-        attachment = LessonAttachment.objects.create(
-            lesson_learned=lesson_learned,
-            file=file,
-            file_type=file_type,
-            original_name=original_name,
-            description=description,
+        return LessonAttachmentService.add_attachments(
+            lesson_learned,
+            [
+                {
+                    "file": file,
+                    "file_type": file_type,
+                    "original_name": original_name,
+                    "description": description,
+                }
+            ],
+        )[0]
+
+    @staticmethod
+    def add_attachments(lesson_learned: LessonLearned, files_data: list[dict]) -> list:
+        """
+        Add several attachments to a lesson learned in a single INSERT.
+
+        Each item in files_data provides file, file_type, original_name and
+        optionally description.
+        """
+        attachments = LessonAttachment.objects.bulk_create(
+            [
+                LessonAttachment(
+                    lesson_learned=lesson_learned,
+                    file=data["file"],
+                    file_type=data["file_type"],
+                    original_name=data["original_name"],
+                    description=data.get("description", ""),
+                )
+                for data in files_data
+            ],
+            batch_size=100,
         )
 
-        logger.info(f"Attachment added to lesson {lesson_learned.id}: {attachment.id}")
-        return attachment
+        logger.info("%s attachment(s) added to lesson %s", len(attachments), lesson_learned.id)
+        return attachments
 
     @staticmethod
     def delete_attachment(attachment: LessonAttachment) -> None:
@@ -378,21 +467,34 @@ class LessonCommentService:
     @staticmethod
     def get_comments(lesson_learned: LessonLearned, approved_only: bool = True):
         """
-        Get comments for a lesson learned.
+        Get top-level comments for a lesson learned.
+
+        The whole thread is fetched in a single query and grouped by parent
+        in Python; each top-level comment exposes its replies as
+        ``reply_list``. ``approved_only`` filters top-level comments only;
+        replies are always included.
         """
-        queryset = (
-            LessonComment.objects.filter(
-                lesson_learned=lesson_learned,
-                parent__isnull=True,  # Only top-level comments
-            )
-            .select_related("user")
-            .prefetch_related("replies__user")
+        queryset = LessonComment.objects.filter(lesson_learned=lesson_learned).select_related(
+            "user"
         )
 
         if approved_only:
-            queryset = queryset.filter(is_approved=True)
+            queryset = queryset.filter(Q(parent__isnull=False) | Q(is_approved=True))
+
+        comments = list(queryset.order_by("created_at"))
+
+        children = defaultdict(list)
+        for comment in comments:
+            if comment.parent_id is not None:
+                children[comment.parent_id].append(comment)
 
-        return queryset.order_by("created_at")
+        top_level = []
+        for comment in comments:
+            if comment.parent_id is None:
+                comment.reply_list = children[comment.id]
+                top_level.append(comment)
+
+        return top_level
 
     @staticmethod
     def moderate_comment(
@@ -432,6 +534,30 @@ class CategoryService:
             .order_by("order", "name")
         )
 
+    @staticmethod
+    def get_cached_active_categories() -> list[dict]:
+        """
+        Get active categories for dropdowns, ordered by name.
+
+        Cached until a category is saved or deleted (see signals).
+        """
+        return cache.get_or_set(
+            ACTIVE_CATEGORIES_CACHE_KEY,
+            lambda: list(
+                Category.objects.filter(is_active=True)
+                .order_by("name")
+                .values("id", "name", "icon")
+            ),
+            timeout=None,
+        )
+
+    @staticmethod
+    def invalidate_active_categories() -> None:
+        """
+        Drop the cached active category list.
+        """
+        cache.delete(ACTIVE_CATEGORIES_CACHE_KEY)
+
     @staticmethod
     def get_category_tree():
         """
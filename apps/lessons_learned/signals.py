@@ -0,0 +1,39 @@
+"""
+Signals for lessons_learned app.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Category, LessonLearned
+from .services import CategoryService, LessonLearnedService
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_cache(sender, instance, **kwargs):
+    """Drop the cached category dropdown whenever a category changes."""
+    CategoryService.invalidate_active_categories()
+
+
+@receiver(pre_save, sender=LessonLearned)
+def track_lesson_category_change(sender, instance, update_fields=None, **kwargs):
+    """Remember the stored category so a move also drops the old statistics."""
+    instance._previous_category_id = None
+    if not instance.pk or (update_fields is not None and "category" not in update_fields):
+        return
+
+    instance._previous_category_id = (
+        LessonLearned.objects.filter(pk=instance.pk).values_list("category_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=LessonLearned)
+@receiver(post_delete, sender=LessonLearned)
+def invalidate_lesson_statistics(sender, instance, **kwargs):
+    """Drop cached lesson statistics whenever a lesson changes."""
+    LessonLearnedService.invalidate_lessons_statistics(instance.category_id)
+
+    previous_category_id = getattr(instance, "_previous_category_id", None)
+    if previous_category_id and previous_category_id != instance.category_id:
+        LessonLearnedService.invalidate_lessons_statistics(previous_category_id)
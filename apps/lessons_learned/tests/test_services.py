@@ -0,0 +1,227 @@
+"""
+Tests for lessons learned services and the lesson grid pagination.
+"""
+
+from datetime import date, datetime, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.lessons_learned.models import Category, LessonComment, LessonLearned
+from apps.lessons_learned.services import LessonCommentService, LessonLearnedService
+
+
+class PaginateByCursorTests(TestCase):
+    """Tests for keyset pagination of approved lessons."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="cursortest@example.com",
+            password="testpass123",
+            first_name="Test",
+            last_name="User",
+            document_number="42345678",
+            job_position="Developer",
+            job_profile="LINIERO",
+            hire_date=date(2024, 1, 1),
+        )
+        cls.category = Category.objects.create(
+            name="Seguridad",
+            description="Lecciones de seguridad",
+        )
+
+        base = timezone.make_aware(datetime(2024, 6, 1, 12, 0))
+        # Two pairs of lessons share a timestamp to exercise the id tie-break
+        offsets = [0, 0, 1, 2, 2]
+        cls.lessons = []
+        for index, offset in enumerate(offsets):
+            lesson = LessonLearned.objects.create(
+                title=f"Lección {index}",
+                description="Descripción",
+                category=cls.category,
+                lesson_type=LessonLearned.Type.OBSERVATION,
+                severity=LessonLearned.Severity.MEDIUM,
+                status=LessonLearned.Status.APPROVED,
+                situation="Situación de prueba",
+                lesson="Lección aprendida",
+                recommendations="Recomendaciones",
+                created_by=cls.user,
+            )
+            LessonLearned.objects.filter(pk=lesson.pk).update(
+                created_at=base + timedelta(hours=offset)
+            )
+            cls.lessons.append(lesson)
+
+        cls.expected_ids = list(
+            LessonLearned.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+
+    def _paginate(self, cursor=None, page_size=2):
+        return LessonLearnedService.paginate_by_cursor(
+            LessonLearnedService.get_approved_lessons(), cursor, page_size=page_size
+        )
+
+    def test_first_page_ordered_by_created_at_then_id(self):
+        """Test the first page follows (created_at DESC, id DESC)."""
+        lessons, next_cursor = self._paginate()
+
+        self.assertEqual([lesson.id for lesson in lessons], self.expected_ids[:2])
+        self.assertIsNotNone(next_cursor)
+
+    def test_cursor_round_trip_walks_every_lesson_once(self):
+        """Test following next_cursor visits each lesson exactly once, in order."""
+        seen = []
+        cursor = None
+        while True:
+            lessons, cursor = self._paginate(cursor)
+            seen.extend(lesson.id for lesson in lessons)
+            if cursor is None:
+                break
+
+        self.assertEqual(seen, self.expected_ids)
+
+    def test_tie_break_on_equal_created_at(self):
+        """Test a page boundary inside equal timestamps does not skip or repeat."""
+        first, cursor = self._paginate(page_size=1)
+        second, _ = self._paginate(cursor, page_size=1)
+
+        self.assertEqual(first[0].created_at, second[0].created_at)
+        self.assertEqual([first[0].id, second[0].id], self.expected_ids[:2])
+
+    def test_last_page_has_no_next_cursor(self):
+        """Test the last page returns no cursor."""
+        lessons, next_cursor = self._paginate(page_size=len(self.expected_ids))
+
+        self.assertEqual(len(lessons), len(self.expected_ids))
+        self.assertIsNone(next_cursor)
+
+    def test_invalid_cursor_raises(self):
+        """Test malformed cursors and impossible dates are rejected."""
+        for cursor in ["garbage", "2024-06-01T12:00:00:abc", "2024-13-45T00:00:00:5"]:
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                self._paginate(cursor)
+
+    def test_lesson_grid_rejects_invalid_cursor(self):
+        """Test the grid view answers 400 instead of serving page one again."""
+        self.client.force_login(self.user)
+
+        response = self.client.get(
+            reverse("lessons_learned:grid"), {"cursor": "2024-13-45T00:00:00:5"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+class LessonStatisticsCacheTests(TestCase):
+    """Tests for invalidation of the cached per-category statistics."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="statstest@example.com",
+            password="testpass123",
+            first_name="Test",
+            last_name="User",
+            document_number="52345678",
+            job_position="Developer",
+            job_profile="LINIERO",
+            hire_date=date(2024, 1, 1),
+        )
+        cls.old_category = Category.objects.create(name="Seguridad", description="Seguridad")
+        cls.new_category = Category.objects.create(name="Operaciones", description="Operaciones")
+
+    def setUp(self):
+        cache.clear()
+        self.lesson = LessonLearned.objects.create(
+            title="Lección",
+            description="Descripción",
+            category=self.old_category,
+            lesson_type=LessonLearned.Type.OBSERVATION,
+            severity=LessonLearned.Severity.MEDIUM,
+            situation="Situación de prueba",
+            lesson="Lección aprendida",
+            recommendations="Recomendaciones",
+            created_by=self.user,
+        )
+
+    def test_moving_lesson_refreshes_both_categories(self):
+        """Test moving a lesson drops the cached statistics of the old category too."""
+        get_stats = LessonLearnedService.get_lessons_statistics
+        self.assertEqual(get_stats(self.old_category)["total"], 1)
+        self.assertEqual(get_stats(self.new_category)["total"], 0)
+
+        LessonLearnedService.update_lesson(
+            self.lesson,
+            title=self.lesson.title,
+            description=self.lesson.description,
+            category=self.new_category,
+            situation=self.lesson.situation,
+            lesson_text=self.lesson.lesson,
+            recommendations=self.lesson.recommendations,
+        )
+
+        self.assertEqual(get_stats(self.old_category)["total"], 0)
+        self.assertEqual(get_stats(self.new_category)["total"], 1)
+
+
+class LessonCommentThreadTests(TestCase):
+    """Tests for building the comment thread of a lesson."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="commenttest@example.com",
+            password="testpass123",
+            first_name="Test",
+            last_name="User",
+            document_number="62345678",
+            job_position="Developer",
+            job_profile="LINIERO",
+            hire_date=date(2024, 1, 1),
+        )
+        category = Category.objects.create(name="Seguridad", description="Seguridad")
+        cls.lesson = LessonLearned.objects.create(
+            title="Lección",
+            description="Descripción",
+            category=category,
+            lesson_type=LessonLearned.Type.OBSERVATION,
+            severity=LessonLearned.Severity.MEDIUM,
+            situation="Situación de prueba",
+            lesson="Lección aprendida",
+            recommendations="Recomendaciones",
+            created_by=cls.user,
+        )
+
+        def comment(content, **kwargs):
+            return LessonComment.objects.create(
+                lesson_learned=cls.lesson, user=cls.user, content=content, **kwargs
+            )
+
+        cls.approved = comment("Aprobado")
+        cls.hidden = comment("Oculto", is_approved=False)
+        cls.approved_reply = comment("Respuesta", parent=cls.approved)
+        cls.unapproved_reply = comment(
+            "Respuesta pendiente", parent=cls.approved, is_approved=False
+        )
+        comment("Respuesta a oculto", parent=cls.hidden)
+
+    def test_approved_only_filters_top_level_comments(self):
+        """Test unapproved top-level comments are hidden but every reply is kept."""
+        comments = LessonCommentService.get_comments(self.lesson)
+
+        self.assertEqual([c.id for c in comments], [self.approved.id])
+        self.assertEqual(
+            [reply.id for reply in comments[0].reply_list],
+            [self.approved_reply.id, self.unapproved_reply.id],
+        )
+
+    def test_all_comments_when_not_approved_only(self):
+        """Test approved_only=False returns every top-level comment."""
+        comments = LessonCommentService.get_comments(self.lesson, approved_only=False)
+
+        self.assertEqual([c.id for c in comments], [self.approved.id, self.hidden.id])
+        self.assertEqual(len(comments[1].reply_list), 1)
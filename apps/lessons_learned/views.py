@@ -4,23 +4,37 @@ Lessons Learned views for SD LMS.
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.core.paginator import Paginator
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_GET, require_POST
 
 from apps.lessons_learned.models import Category, LessonLearned
 from apps.lessons_learned.services import (
+    CategoryService,
     LessonCommentService,
     LessonLearnedService,
 )
 
 
+def _get_lesson_thin(lesson_id):
+    """
+    Fetch a lesson with only the columns needed by the workflow views.
+
+    Deferred fields are not written back on save(), so updated_at is loaded
+    to keep auto_now working; title and category are read by post_save
+    receivers.
+    """
+    return get_object_or_404(
+        LessonLearned.objects.only("id", "title", "category", "created_by", "status", "updated_at"),
+        id=lesson_id,
+    )
+
+
 @login_required
 @require_GET
 def lesson_list(request):
     """Lesson list page."""
-    categories = Category.objects.filter(is_active=True).order_by("name")
+    categories = CategoryService.get_cached_active_categories()
 
     context = {
         "categories": categories,
@@ -41,7 +55,7 @@ def lesson_grid(request):
     severity = request.GET.get("severity")
     lesson_type = request.GET.get("type")
     search = request.GET.get("search")
-    page = request.GET.get("page", 1)
+    cursor = request.GET.get("cursor")
 
     # Get approved lessons
     category = None
@@ -55,10 +69,16 @@ def lesson_grid(request):
         search=search,
     )
 
-    paginator = Paginator(lessons, 12)
-    page_obj = paginator.get_page(page)
+    try:
+        lessons, next_cursor = LessonLearnedService.paginate_by_cursor(lessons, cursor)
+    except ValueError:
+        return HttpResponse("Cursor de paginación inválido", status=400)
 
-    context = {"lessons": page_obj}
+    context = {
+        "lessons": lessons,
+        "next_cursor": next_cursor,
+        "is_next_page": bool(cursor),
+    }
     return render(request, "lessons_learned/partials/lesson_grid.html", context)
 
 
@@ -73,14 +93,17 @@ def lesson_detail(request, lesson_id):
     # Increment view count
     LessonLearnedService.increment_view_count(lesson)
 
-    context = {"lesson": lesson}
+    context = {
+        "lesson": lesson,
+        "comments": LessonCommentService.get_comments(lesson),
+    }
     return render(request, "lessons_learned/lesson_detail.html", context)
 
 
 @login_required
 def lesson_create(request):
     """Create a new lesson."""
-    categories = Category.objects.filter(is_active=True)
+    categories = CategoryService.get_cached_active_categories()
 
     if request.method == "POST":
         category_id = request.POST.get("category")
@@ -118,7 +141,7 @@ def lesson_edit(request, lesson_id):
         messages.error(request, "No tienes permiso para editar esta lección")
         return redirect("lessons_learned:detail", lesson_id=lesson.id)
 
-    categories = Category.objects.filter(is_active=True)
+    categories = CategoryService.get_cached_active_categories()
 
     if request.method == "POST":
         category_id = request.POST.get("category")
@@ -150,9 +173,9 @@ def lesson_edit(request, lesson_id):
 @require_POST
 def submit_for_review(request, lesson_id):
     """Submit lesson for review."""
-    lesson = get_object_or_404(LessonLearned, id=lesson_id)
+    lesson = _get_lesson_thin(lesson_id)
 
-    if lesson.created_by != request.user:
+    if lesson.created_by_id != request.user.id:
         return HttpResponse("No autorizado", status=403)
 
     LessonLearnedService.submit_for_review(lesson)
@@ -171,7 +194,7 @@ def approve_lesson(request, lesson_id):
     if not request.user.is_staff:
         return HttpResponse("No autorizado", status=403)
 
-    lesson = get_object_or_404(LessonLearned, id=lesson_id)
+    lesson = _get_lesson_thin(lesson_id)
     notes = request.POST.get("notes", "")
 
     LessonLearnedService.approve_lesson(lesson, request.user, notes)
@@ -190,7 +213,7 @@ def reject_lesson(request, lesson_id):
     if not request.user.is_staff:
         return HttpResponse("No autorizado", status=403)
 
-    lesson = get_object_or_404(LessonLearned, id=lesson_id)
+    lesson = _get_lesson_thin(lesson_id)
     reason = request.POST.get("reason", "")
 
     if not reason:
@@ -209,7 +232,7 @@ def reject_lesson(request, lesson_id):
 @require_POST
 def add_comment(request, lesson_id):
     """Add a comment to a lesson."""
-    lesson = get_object_or_404(LessonLearned, id=lesson_id)
+    lesson = _get_lesson_thin(lesson_id)
     content = request.POST.get("content", "").strip()
 
     if not content:
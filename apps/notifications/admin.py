@@ -36,7 +36,8 @@ class NotificationAdmin(admin.ModelAdmin):
         "read_at",
     ]
     list_filter = ["status", "channel", "priority", "created_at"]
-    search_fields = ["subject", "body", "user__email"]
+    search_fields = ["subject", "user__email"]
+    show_full_result_count = False
     readonly_fields = [
         "created_at",
         "sent_at",
@@ -151,6 +151,19 @@ class PushSubscriptionSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "created_at", "last_used_at"]
 
+    def validate_endpoint(self, value):
+        """Reject moving a subscription onto another endpoint the user already has."""
+        if self.instance is None or value == self.instance.endpoint:
+            return value
+
+        duplicate = PushSubscription.objects.filter(
+            user_id=self.instance.user_id,
+            endpoint=value,
+        ).exists()
+        if duplicate:
+            raise serializers.ValidationError("Ya existe una suscripción para este endpoint.")
+        return value
+
 
 class MarkReadSerializer(serializers.Serializer):
     """Serializer for marking notifications as read."""
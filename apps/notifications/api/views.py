@@ -2,8 +2,10 @@
 ViewSets for notifications API.
 """
 
+from django.db import transaction
 from django.db.models import Q
-from django.shortcuts import get_object_or_404
+from django.db.models.functions import Now
+from django.http import Http404
 from django.utils import timezone
 
 from rest_framework import permissions, status, viewsets
@@ -17,6 +19,11 @@ from apps.notifications.models import (
     PushSubscription,
     UserNotificationPreference,
 )
+from apps.notifications.services import (
+    NotificationService,
+    NotificationTemplateService,
+    UserPreferenceService,
+)
 
 from .serializers import (
     MarkReadSerializer,
@@ -28,6 +35,13 @@ from .serializers import (
     UserNotificationPreferenceSerializer,
 )
 
+# Allowed values for the notification list query filters
+CHOICE_FILTERS = {
+    "status": frozenset(Notification.Status.values),
+    "channel": frozenset(NotificationTemplate.Channel.values),
+    "priority": frozenset(Notification.Priority.values),
+}
+
 
 class NotificationTemplateViewSet(viewsets.ModelViewSet):
     """ViewSet for managing notification templates."""
@@ -62,37 +76,33 @@ class NotificationViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        queryset = Notification.objects.select_related("template")
+        if self.action == "list":
+            queryset = Notification.objects.for_list()
+        else:
+            queryset = Notification.objects.select_related("template", "user")
 
         # Non-staff users see only their own notifications
         if not self.request.user.is_staff:
-            queryset = queryset.filter(user=self.request.user)
+            queryset = queryset.for_user(self.request.user)
         else:
             # Staff can filter by user
             user_id = self.request.query_params.get("user")
             if user_id:
                 queryset = queryset.filter(user_id=user_id)
 
-        # Filter by status
-        notification_status = self.request.query_params.get("status")
-        if notification_status:
-            queryset = queryset.filter(status=notification_status)
-
-        # Filter by channel
-        channel = self.request.query_params.get("channel")
-        if channel:
-            queryset = queryset.filter(channel=channel)
+        # Filter by status, channel and priority; unknown values match nothing
+        for param, allowed_values in CHOICE_FILTERS.items():
+            value = self.request.query_params.get(param)
+            if value:
+                if value not in allowed_values:
+                    return queryset.none()
+                queryset = queryset.filter(**{param: value})
 
         # Filter by unread
         unread = self.request.query_params.get("unread")
         if unread and unread.lower() == "true":
             queryset = queryset.filter(read_at__isnull=True)
 
-        # Filter by priority
-        priority = self.request.query_params.get("priority")
-        if priority:
-            queryset = queryset.filter(priority=priority)
-
         return queryset.order_by("-created_at")
 
     def get_serializer_class(self):
@@ -103,10 +113,7 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def unread_count(self, request):
         """Get count of unread notifications."""
-        count = Notification.objects.filter(
-            user=request.user,
-            read_at__isnull=True,
-        ).count()
+        count = NotificationService.get_unread_count(request.user)
         return Response({"count": count})
 
     @action(detail=True, methods=["post"])
@@ -123,7 +130,8 @@ class NotificationViewSet(viewsets.ModelViewSet):
         if notification.read_at is None:
             notification.read_at = timezone.now()
             notification.status = Notification.Status.READ
-            notification.save()
+            notification.save(update_fields=["read_at", "status"])
+            NotificationService.invalidate_unread_count(notification.user_id)
 
         return Response(NotificationSerializer(notification).data)
 
@@ -134,9 +142,10 @@ class NotificationViewSet(viewsets.ModelViewSet):
             user=request.user,
             read_at__isnull=True,
         ).update(
-            read_at=timezone.now(),
+            read_at=Now(),
             status=Notification.Status.READ,
         )
+        NotificationService.invalidate_unread_count(request.user.id)
         return Response({"updated": updated})
 
     @action(detail=False, methods=["post"])
@@ -145,26 +154,24 @@ class NotificationViewSet(viewsets.ModelViewSet):
         serializer = MarkReadSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        if serializer.validated_data.get("mark_all"):
-            updated = Notification.objects.filter(
-                user=request.user,
-                read_at__isnull=True,
-            ).update(
-                read_at=timezone.now(),
-                status=Notification.Status.READ,
-            )
-        else:
+        queryset = Notification.objects.filter(
+            user=request.user,
+            read_at__isnull=True,
+        )
+        if not serializer.validated_data.get("mark_all"):
             notification_ids = serializer.validated_data.get("notification_ids", [])
-            updated = Notification.objects.filter(
-                user=request.user,
-                id__in=notification_ids,
-                read_at__isnull=True,
-            ).update(
-                read_at=timezone.now(),
+            queryset = queryset.filter(id__in=notification_ids)
+
+        # Collect the affected ids so clients can update items without refetching
+        with transaction.atomic():
+            ids = list(queryset.select_for_update().values_list("id", flat=True))
+            updated = Notification.objects.filter(id__in=ids).update(
+                read_at=Now(),
                 status=Notification.Status.READ,
             )
 
-        return Response({"updated": updated})
+        NotificationService.invalidate_unread_count(request.user.id)
+        return Response({"updated": updated, "ids": ids})
 
     @action(detail=False, methods=["post"])
     def send(self, request):
@@ -191,30 +198,41 @@ class NotificationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        users = User.objects.filter(id__in=user_ids, is_active=True)
+        recipient_ids = list(
+            User.objects.filter(id__in=user_ids, is_active=True).values_list("id", flat=True)
+        )
 
         # Get template if specified
         template = None
         if data.get("template_id"):
-            template = get_object_or_404(NotificationTemplate, pk=data["template_id"])
-
-        # Create notifications
-        notifications = []
-        for user in users:
-            notification = Notification.objects.create(
-                user=user,
-                template=template,
-                channel=data.get("channel", template.channel if template else "in_app"),
-                subject=data["subject"],
-                body=data["body"],
-                priority=data.get("priority", Notification.Priority.NORMAL),
-                action_url=data.get("action_url", ""),
-                action_text=data.get("action_text", ""),
-                metadata=data.get("metadata", {}),
-                status=Notification.Status.SENT,
-                sent_at=timezone.now(),
-            )
-            notifications.append(notification)
+            template = NotificationTemplateService.get_template_cached(data["template_id"])
+            if template is None:
+                raise Http404
+
+        # Create notifications in a single multi-row INSERT
+        now = timezone.now()
+        channel = data.get("channel", template.channel if template else "in_app")
+        priority = data.get("priority", Notification.Priority.NORMAL)
+        notifications = Notification.objects.bulk_create(
+            [
+                Notification(
+                    user_id=recipient_id,
+                    template=template,
+                    channel=channel,
+                    subject=data["subject"],
+                    body=data["body"],
+                    priority=priority,
+                    action_url=data.get("action_url", ""),
+                    action_text=data.get("action_text", ""),
+                    metadata=data.get("metadata", {}),
+                    status=Notification.Status.SENT,
+                    sent_at=now,
+                )
+                for recipient_id in recipient_ids
+            ],
+            batch_size=500,
+        )
+        NotificationService.invalidate_unread_count(*recipient_ids)
 
         return Response(
             {"created": len(notifications)},
@@ -233,8 +251,7 @@ class UserNotificationPreferenceViewSet(viewsets.ModelViewSet):
 
     def get_object(self):
         """Get or create preferences for current user."""
-        obj, created = UserNotificationPreference.objects.get_or_create(user=self.request.user)
-        return obj
+        return UserPreferenceService.get_or_create_preferences(self.request.user)
 
     def list(self, request, *args, **kwargs):
         """Return the user's preferences."""
@@ -262,7 +279,17 @@ class PushSubscriptionViewSet(viewsets.ModelViewSet):
         return PushSubscription.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        serializer.save(user=self.request.user)
+        serializer.instance, _ = self._upsert_subscription(serializer.validated_data)
+
+    def _upsert_subscription(self, validated_data, **extra):
+        """Reuse the user's subscription for the same endpoint if there is one."""
+        defaults = dict(validated_data)
+        endpoint = defaults.pop("endpoint")
+        return PushSubscription.objects.update_or_create(
+            user=self.request.user,
+            endpoint=endpoint,
+            defaults={**defaults, **extra},
+        )
 
     @action(detail=False, methods=["post"])
     def subscribe(self, request):
@@ -270,26 +297,11 @@ class PushSubscriptionViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        # Check for existing subscription with same endpoint
-        endpoint = serializer.validated_data["endpoint"]
-        existing = PushSubscription.objects.filter(
-            user=request.user,
-            endpoint=endpoint,
-        ).first()
-
-        if existing:
-            # Update existing
-            for key, value in serializer.validated_data.items():
-                setattr(existing, key, value)
-            existing.is_active = True
-            existing.save()
-            return Response(PushSubscriptionSerializer(existing).data)
-
-        # Create new
-        instance = serializer.save(user=request.user)
+        instance, created = self._upsert_subscription(serializer.validated_data, is_active=True)
+
         return Response(
             PushSubscriptionSerializer(instance).data,
-            status=status.HTTP_201_CREATED,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
 
     @action(detail=False, methods=["post"])
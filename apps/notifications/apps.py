@@ -5,3 +5,6 @@ class NotificationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.notifications"
     verbose_name = "Notificaciones"
+
+    def ready(self):
+        import apps.notifications.signals  # noqa: F401
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_alter_notification_action_url"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("read_at__isnull", True)),
+                fields=["user", "-created_at"],
+                name="notif_unread_idx",
+            ),
+        ),
+    ]
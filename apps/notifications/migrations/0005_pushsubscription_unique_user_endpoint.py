@@ -0,0 +1,41 @@
+# Generated by Django 5.1.15 on 2026-10-16 10:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def remove_duplicate_subscriptions(apps, schema_editor):
+    """Keep only the most recent subscription per (user, endpoint)."""
+    PushSubscription = apps.get_model("notifications", "PushSubscription")
+
+    duplicates = (
+        PushSubscription.objects.values("user_id", "endpoint")
+        .annotate(count=models.Count("id"), keep_id=models.Max("id"))
+        .filter(count__gt=1)
+    )
+    for row in duplicates:
+        PushSubscription.objects.filter(
+            user_id=row["user_id"],
+            endpoint=row["endpoint"],
+        ).exclude(id=row["keep_id"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0004_notification_unread_partial_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_subscriptions, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="pushsubscription",
+            name="endpoint",
+            field=models.URLField(db_index=True, verbose_name="Endpoint"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="pushsubscription",
+            unique_together={("user", "endpoint")},
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.15 on 2026-10-16 11:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0005_pushsubscription_unique_user_endpoint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="notification",
+            name="notificatio_user_id_8ab96f_idx",
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "status", "-created_at"], name="notificatio_user_id_a34568_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "channel", "-created_at"], name="notificatio_user_id_835424_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "priority", "-created_at"], name="notificatio_user_id_316243_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-16 12:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0007_notification_user_created_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["status", "retry_count"], name="notificatio_status_8a4412_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(fields=["status", "read_at"], name="notificatio_status_233bed_idx"),
+        ),
+    ]
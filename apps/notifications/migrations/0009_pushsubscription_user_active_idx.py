@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-16 12:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0008_notification_status_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pushsubscription",
+            index=models.Index(fields=["user", "is_active"], name="push_subscr_user_id_c81a15_idx"),
+        ),
+    ]
@@ -8,15 +8,37 @@ from django.utils.translation import gettext_lazy as _
 from apps.core.validators import validate_url
 
 
-class NotificationManager(models.Manager):
-    """Custom manager for Notification model."""
+class NotificationQuerySet(models.QuerySet):
+    """Chainable queryset helpers for Notification."""
+
+    # Columns rendered by list endpoints; body and metadata are left out
+    LIST_FIELDS = (
+        "id",
+        "user",
+        "channel",
+        "subject",
+        "status",
+        "priority",
+        "action_url",
+        "read_at",
+        "created_at",
+        "template",
+        "template__name",
+    )
 
     def unread(self):
-        return self.filter(status="unread")
+        return self.filter(read_at__isnull=True)
 
     def for_user(self, user):
         return self.filter(user=user)
 
+    def for_list(self):
+        return self.select_related("template").only(*self.LIST_FIELDS)
+
+
+class NotificationManager(models.Manager.from_queryset(NotificationQuerySet)):
+    """Custom manager for Notification model."""
+
 
 class NotificationTemplate(models.Model):
     """
@@ -147,8 +169,19 @@ class Notification(models.Model):
         verbose_name_plural = _("Notificaciones")
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["user", "status"]),
+            models.Index(fields=["user", "status", "-created_at"]),
+            models.Index(fields=["user", "channel", "-created_at"]),
+            models.Index(fields=["user", "priority", "-created_at"]),
+            models.Index(fields=["user", "-created_at"]),
+            # Staff list across all users, ordered newest first
             models.Index(fields=["-created_at", "user"]),
+            models.Index(fields=["status", "retry_count"]),
+            models.Index(fields=["status", "read_at"]),
+            models.Index(
+                fields=["user", "-created_at"],
+                name="notif_unread_idx",
+                condition=models.Q(read_at__isnull=True),
+            ),
         ]
 
     def __str__(self):
@@ -231,7 +264,7 @@ class PushSubscription(models.Model):
         related_name="push_subscriptions",
         verbose_name=_("Usuario"),
     )
-    endpoint = models.URLField(_("Endpoint"))
+    endpoint = models.URLField(_("Endpoint"), db_index=True)
     p256dh_key = models.CharField(_("Clave P256DH"), max_length=255)
     auth_key = models.CharField(_("Clave de autenticación"), max_length=255)
     device_name = models.CharField(_("Nombre del dispositivo"), max_length=100, blank=True)
@@ -244,6 +277,10 @@ class PushSubscription(models.Model):
         db_table = "push_subscriptions"
         verbose_name = _("Suscripción push")
         verbose_name_plural = _("Suscripciones push")
+        unique_together = ["user", "endpoint"]
+        indexes = [
+            models.Index(fields=["user", "is_active"]),
+        ]
 
     def __str__(self):
         return f"{self.user} - {self.device_name or 'Unknown'}"
@@ -5,6 +5,7 @@ Service for sending bulk notifications.
 import logging
 
 from django.db import transaction
+from django.db.models import QuerySet
 
 from apps.notifications.models import Notification, NotificationTemplate
 from apps.notifications.services.notification import NotificationService
@@ -12,6 +13,18 @@ from apps.notifications.services.templates import NotificationTemplateService
 
 logger = logging.getLogger(__name__)
 
+# Indexed by how many of the 3-day and 1-day thresholds a deadline is within
+DEADLINE_PRIORITIES = (
+    Notification.Priority.NORMAL,
+    Notification.Priority.HIGH,
+    Notification.Priority.URGENT,
+)
+
+
+def _format_date(value) -> str:
+    """Format a date as dd/mm/yyyy without going through locale-aware strftime."""
+    return f"{value.day:02d}/{value.month:02d}/{value.year}"
+
 
 class BulkNotificationService:
     """Service for sending bulk notifications."""
@@ -29,20 +42,32 @@ class BulkNotificationService:
         """
         Send notification to multiple users.
         """
-        notifications = []
-
-        for user in users:
-            notification = NotificationService.create_notification(
-                user=user,
-                subject=subject,
-                body=body,
-                channel=channel,
-                priority=priority,
-                action_url=action_url,
-            )
-            notifications.append(notification)
+        # Only the primary key is needed, so querysets skip hydrating users
+        if isinstance(users, QuerySet):
+            user_ids = users.values_list("id", flat=True)
+        else:
+            user_ids = [user.pk for user in users]
+
+        notifications = Notification.objects.bulk_create(
+            [
+                Notification(
+                    user_id=user_id,
+                    channel=channel,
+                    subject=subject,
+                    body=body,
+                    status=Notification.Status.PENDING,
+                    priority=priority,
+                    action_url=action_url,
+                    metadata={},
+                )
+                for user_id in user_ids
+            ],
+            batch_size=500,
+        )
+        NotificationService.invalidate_unread_count(*(n.user_id for n in notifications))
+        NotificationService.queue_delivery(*(n.id for n in notifications))
 
-        logger.info(f"Bulk notification created for {len(notifications)} users")
+        logger.info("Bulk notification created for %s users", len(notifications))
         return notifications
 
     @staticmethod
@@ -64,7 +89,11 @@ class BulkNotificationService:
         if not template:
             raise ValueError(f"Template '{template_name}' not found")
 
-        notifications = []
+        if user_context_fn is None and isinstance(users, QuerySet):
+            # The default context only reads the user's names
+            users = users.only("id", "first_name", "last_name")
+
+        pending = []
 
         for user in users:
             # Get user-specific context if function provided
@@ -78,18 +107,24 @@ class BulkNotificationService:
 
             rendered = NotificationTemplateService.render_template(template, user_context)
 
-            notification = NotificationService.create_notification(
-                user=user,
-                subject=rendered["subject"],
-                body=rendered["body"],
-                channel=channel or template.channel,
-                template=template,
-                priority=priority,
-                metadata={"context": user_context},
+            pending.append(
+                Notification(
+                    user=user,
+                    template=template,
+                    channel=channel or template.channel,
+                    subject=rendered["subject"],
+                    body=rendered["body"],
+                    status=Notification.Status.PENDING,
+                    priority=priority,
+                    metadata={"context": user_context},
+                )
             )
-            notifications.append(notification)
 
-        logger.info(f"Bulk template notification created for {len(notifications)} users")
+        notifications = Notification.objects.bulk_create(pending, batch_size=500)
+        NotificationService.invalidate_unread_count(*(n.user_id for n in notifications))
+        NotificationService.queue_delivery(*(n.id for n in notifications))
+
+        logger.info("Bulk template notification created for %s users", len(notifications))
         return notifications
 
     @staticmethod
@@ -120,16 +155,12 @@ class BulkNotificationService:
         """
         context = {
             "path_name": assignment.learning_path.name,
-            "due_date": assignment.due_date.strftime("%d/%m/%Y"),
+            "due_date": _format_date(assignment.due_date),
             "days_left": days_left,
             "user_name": assignment.user.get_full_name(),
         }
 
-        priority = Notification.Priority.NORMAL
-        if days_left <= 3:
-            priority = Notification.Priority.HIGH
-        if days_left <= 1:
-            priority = Notification.Priority.URGENT
+        priority = DEADLINE_PRIORITIES[(days_left <= 3) + (days_left <= 1)]
 
         return NotificationService.send_from_template(
             user=assignment.user,
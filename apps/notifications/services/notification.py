@@ -4,9 +4,13 @@ Main notification service for notification operations.
 
 import logging
 
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models.functions import Now
 from django.utils import timezone
 
+from celery import group
+
 from apps.notifications.models import (
     Notification,
     NotificationTemplate,
@@ -17,6 +21,21 @@ from apps.notifications.services.templates import NotificationTemplateService
 
 logger = logging.getLogger(__name__)
 
+UNREAD_COUNT_CACHE_KEY = "notif:unread:{}"
+UNREAD_COUNT_CACHE_TIMEOUT = 30
+
+SECONDS_PER_DAY = 24 * 60 * 60
+DELETE_BATCH_SIZE = 10000
+RETRY_BATCH_SIZE = 500
+
+# Columns written by a dispatch attempt
+DISPATCH_FIELDS = ["status", "sent_at", "error_message", "retry_count"]
+
+
+def _seconds_of_day(value) -> int:
+    """Convert a time of day to seconds since midnight."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
 
 class NotificationService:
     """Service for notification operations."""
@@ -36,7 +55,11 @@ class NotificationService:
     ) -> Notification:
         """
         Create a new notification for a user.
+
+        Sending is queued as a Celery task after the transaction commits.
         """
+        from apps.notifications.tasks import send_notification_task
+
         notification = Notification.objects.create(
             user=user,
             template=template,
@@ -50,9 +73,29 @@ class NotificationService:
             metadata=metadata or {},
         )
 
+        # Deliver outside the request once the row is visible to workers
+        transaction.on_commit(lambda: send_notification_task.delay(notification.id))
+
         logger.info(f"Notification created: {notification.id} for user {user.id}")
         return notification
 
+    @staticmethod
+    def queue_delivery(*notification_ids) -> None:
+        """
+        Queue delivery of several notifications as one Celery group once
+        the current transaction commits.
+        """
+        from apps.notifications.tasks import send_notification_task
+
+        if not notification_ids:
+            return
+
+        transaction.on_commit(
+            lambda: group(
+                send_notification_task.s(notification_id) for notification_id in notification_ids
+            ).apply_async()
+        )
+
     @staticmethod
     @transaction.atomic
     def send_from_template(
@@ -89,24 +132,47 @@ class NotificationService:
         return notification
 
     @staticmethod
-    def send_notification(notification: Notification) -> Notification:
+    def send_notification(
+        notification: Notification,
+        raise_transient: bool = False,
+    ) -> Notification:
         """
         Send a notification through its channel.
+
+        With raise_transient, connection and timeout errors propagate
+        instead of marking the notification failed, so the caller can retry.
+        """
+        if NotificationService._dispatch(notification, raise_transient):
+            notification.save(update_fields=DISPATCH_FIELDS)
+        return notification
+
+    @staticmethod
+    def _dispatch(notification: Notification, raise_transient: bool = False) -> bool:
+        """
+        Send a notification and record the outcome on the instance only.
+
+        Callers persist DISPATCH_FIELDS. Returns False when sending was
+        deferred and the instance is unchanged.
         """
         # Import here to avoid circular imports
         from apps.notifications.services.push import PushService
 
+        # Resolve preferences once for both checks
+        try:
+            prefs = notification.user.notification_preferences
+        except UserNotificationPreference.DoesNotExist:
+            prefs = None
+
         # Check user preferences
-        if not NotificationService._can_send(notification):
+        if not NotificationService._can_send(notification, prefs):
             notification.status = Notification.Status.FAILED
             notification.error_message = "User has disabled this notification type"
-            notification.save()
-            return notification
+            return True
 
         # Check quiet hours
-        if NotificationService._in_quiet_hours(notification.user):
+        if NotificationService._in_quiet_hours(prefs):
             # Defer sending - keep as pending
-            return notification
+            return False
 
         try:
             if notification.channel == NotificationTemplate.Channel.EMAIL:
@@ -119,41 +185,42 @@ class NotificationService:
                 # In-app notifications are just marked as sent
                 notification.status = Notification.Status.SENT
                 notification.sent_at = timezone.now()
-                notification.save()
 
             logger.info(f"Notification sent: {notification.id}")
 
         except ValueError as e:
             # Errores de validacion o configuracion (ej: sin suscripciones push)
-            notification.status = Notification.Status.FAILED
-            notification.error_message = str(e)
-            notification.retry_count += 1
-            notification.save()
+            NotificationService._record_failure(notification, str(e))
             logger.warning(f"Error de validacion enviando notificacion {notification.id}: {e}")
-        except ConnectionError as e:
+        except (ConnectionError, TimeoutError) as e:
             # Errores de conexion (temporales, podrian reintentarse)
-            notification.status = Notification.Status.FAILED
-            notification.error_message = f"Error de conexion: {e}"
-            notification.retry_count += 1
-            notification.save()
+            if raise_transient:
+                raise
+            NotificationService._record_failure(notification, f"Error de conexion: {e}")
             logger.error(f"Error de conexion enviando notificacion {notification.id}: {e}")
         except Exception as e:
-            notification.status = Notification.Status.FAILED
-            notification.error_message = "Error inesperado al enviar notificacion."
-            notification.retry_count += 1
-            notification.save()
+            NotificationService._record_failure(
+                notification, "Error inesperado al enviar notificacion."
+            )
             logger.exception(f"Error inesperado enviando notificacion {notification.id}: {e}")
 
-        return notification
+        return True
 
     @staticmethod
-    def _can_send(notification: Notification) -> bool:
+    def _record_failure(notification: Notification, message: str) -> None:
+        """
+        Record a failed delivery attempt on the instance.
+        """
+        notification.status = Notification.Status.FAILED
+        notification.error_message = message
+        notification.retry_count += 1
+
+    @staticmethod
+    def _can_send(notification: Notification, prefs: UserNotificationPreference | None) -> bool:
         """
         Check if notification can be sent based on user preferences.
         """
-        try:
-            prefs = notification.user.notification_preferences
-        except UserNotificationPreference.DoesNotExist:
+        if prefs is None:
             return True  # No preferences = all enabled
 
         # Check channel preference
@@ -173,27 +240,23 @@ class NotificationService:
         return True
 
     @staticmethod
-    def _in_quiet_hours(user) -> bool:
+    def _in_quiet_hours(prefs: UserNotificationPreference | None) -> bool:
         """
         Check if user is in quiet hours.
         """
-        try:
-            prefs = user.notification_preferences
-        except UserNotificationPreference.DoesNotExist:
+        if prefs is None:
             return False
 
         if not prefs.quiet_hours_start or not prefs.quiet_hours_end:
             return False
 
-        now = timezone.localtime().time()
-        start = prefs.quiet_hours_start
-        end = prefs.quiet_hours_end
+        now = _seconds_of_day(timezone.localtime().time())
+        start = _seconds_of_day(prefs.quiet_hours_start)
+        end = _seconds_of_day(prefs.quiet_hours_end)
 
-        # Handle overnight quiet hours
-        if start <= end:
-            return start <= now <= end
-        else:
-            return now >= start or now <= end
+        # Offsets from the window start wrap at midnight, which also covers
+        # overnight quiet hours (e.g. 22:00 - 07:00)
+        return (now - start) % SECONDS_PER_DAY <= (end - start) % SECONDS_PER_DAY
 
     @staticmethod
     def _send_email(notification: Notification) -> None:
@@ -206,7 +269,7 @@ class NotificationService:
         html_message = None
         if notification.template and notification.template.html_body:
             context = notification.metadata.get("context", {})
-            html_message = NotificationTemplateService._render_string(
+            html_message = NotificationTemplateService.render_html(
                 notification.template.html_body, context
             )
 
@@ -221,28 +284,27 @@ class NotificationService:
 
         notification.status = Notification.Status.SENT
         notification.sent_at = timezone.now()
-        notification.save()
 
     @staticmethod
     def _send_push(notification: Notification, PushService) -> None:
         """
         Send push notification.
         """
-        subscriptions = PushSubscription.objects.filter(
-            user=notification.user,
-            is_active=True,
+        subscriptions = list(
+            PushSubscription.objects.filter(
+                user=notification.user,
+                is_active=True,
+            ).only("id", "endpoint", "p256dh_key", "auth_key")
         )
 
-        if not subscriptions.exists():
+        if not subscriptions:
             raise ValueError("No active push subscriptions")
 
         # Send to all active subscriptions
-        for subscription in subscriptions:
-            PushService.send_push(subscription, notification)
+        PushService.send_push_to_subscriptions(subscriptions, notification)
 
         notification.status = Notification.Status.SENT
         notification.sent_at = timezone.now()
-        notification.save()
 
     @staticmethod
     def _send_sms(notification: Notification) -> None:
@@ -253,7 +315,6 @@ class NotificationService:
         # SMS sending logic would go here
         notification.status = Notification.Status.SENT
         notification.sent_at = timezone.now()
-        notification.save()
 
     @staticmethod
     def mark_as_delivered(notification: Notification) -> Notification:
@@ -262,7 +323,10 @@ class NotificationService:
         """
         notification.status = Notification.Status.DELIVERED
         notification.delivered_at = timezone.now()
-        notification.save()
+        Notification.objects.filter(pk=notification.pk).update(
+            status=notification.status,
+            delivered_at=notification.delivered_at,
+        )
 
         return notification
 
@@ -272,9 +336,19 @@ class NotificationService:
         Mark notification as read.
         """
         if not notification.read_at:
-            notification.status = Notification.Status.READ
-            notification.read_at = timezone.now()
-            notification.save()
+            now = timezone.now()
+            updated = Notification.objects.filter(
+                pk=notification.pk,
+                read_at__isnull=True,
+            ).update(status=Notification.Status.READ, read_at=now)
+
+            if updated:
+                notification.status = Notification.Status.READ
+                notification.read_at = now
+                NotificationService.invalidate_unread_count(notification.user_id)
+            else:
+                # Read concurrently; pick up the stored values
+                notification.refresh_from_db(fields=["status", "read_at"])
 
         return notification
 
@@ -283,14 +357,14 @@ class NotificationService:
         """
         Mark all unread notifications for a user as read.
         """
-        now = timezone.now()
         count = Notification.objects.filter(
             user=user,
             read_at__isnull=True,
         ).update(
             status=Notification.Status.READ,
-            read_at=now,
+            read_at=Now(),
         )
+        NotificationService.invalidate_unread_count(user.id)
 
         return count
 
@@ -312,28 +386,68 @@ class NotificationService:
         if channel:
             queryset = queryset.filter(channel=channel)
 
-        return queryset.order_by("-created_at")[:limit]
+        # Only the columns the notification list partials render
+        return queryset.only(
+            "id",
+            "user",
+            "channel",
+            "subject",
+            "body",
+            "status",
+            "priority",
+            "action_url",
+            "action_text",
+            "read_at",
+            "created_at",
+        ).order_by("-created_at")[:limit]
 
     @staticmethod
     def get_unread_count(user) -> int:
         """
         Get count of unread notifications for a user.
+
+        The count is cached for UNREAD_COUNT_CACHE_TIMEOUT seconds since it
+        is polled by the navbar badge on every page.
         """
-        return Notification.objects.filter(
-            user=user,
-            read_at__isnull=True,
-        ).count()
+        key = UNREAD_COUNT_CACHE_KEY.format(user.id)
+        count = cache.get(key)
+        if count is None:
+            count = Notification.objects.filter(
+                user=user,
+                read_at__isnull=True,
+            ).count()
+            cache.set(key, count, UNREAD_COUNT_CACHE_TIMEOUT)
+        return count
+
+    @staticmethod
+    def invalidate_unread_count(*user_ids) -> None:
+        """
+        Drop the cached unread count for the given users.
+        """
+        cache.delete_many([UNREAD_COUNT_CACHE_KEY.format(user_id) for user_id in user_ids])
 
     @staticmethod
     def delete_old_notifications(days: int = 90) -> int:
         """
         Delete old read notifications.
+
+        Rows are removed in batches to keep each DELETE short on large
+        tables. Notification has no dependents or delete signals, so each
+        batch is a single fast-path DELETE statement.
         """
         cutoff = timezone.now() - timezone.timedelta(days=days)
-        deleted, _ = Notification.objects.filter(
+        old = Notification.objects.filter(
             status=Notification.Status.READ,
             read_at__lt=cutoff,
-        ).delete()
+        )
+
+        deleted = 0
+        while True:
+            batch = list(old.values_list("id", flat=True)[:DELETE_BATCH_SIZE])
+            if not batch:
+                break
+            count, _ = Notification.objects.filter(id__in=batch).delete()
+            deleted += count
 
         if deleted > 0:
             logger.info(f"Deleted {deleted} old notifications")
@@ -345,16 +459,29 @@ class NotificationService:
         """
         Retry failed notifications that haven't exceeded max retries.
         """
+        from apps.notifications.tasks import send_notification_task
+
         failed = Notification.objects.filter(
             status=Notification.Status.FAILED,
             retry_count__lt=max_retries,
         )
 
+        # Walk the ids in keyset order so a row that fails again while the
+        # sweep is running is left for the next sweep
         count = 0
-        for notification in failed:
-            notification.status = Notification.Status.PENDING
-            notification.save()
-            NotificationService.send_notification(notification)
-            count += 1
+        last_id = 0
+        while True:
+            batch = list(
+                failed.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:RETRY_BATCH_SIZE]
+            )
+            if not batch:
+                break
+            last_id = batch[-1]
+            Notification.objects.filter(id__in=batch).update(status=Notification.Status.PENDING)
+            for notification_id in batch:
+                send_notification_task.delay(notification_id)
+            count += len(batch)
 
         return count
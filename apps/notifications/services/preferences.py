@@ -2,8 +2,13 @@
 Service for user notification preferences.
 """
 
+from django.core.cache import cache
+
 from apps.notifications.models import UserNotificationPreference
 
+PREFERENCES_CACHE_KEY = "notifpref:{}"
+PREFERENCES_CACHE_TIMEOUT = 300
+
 
 class UserPreferenceService:
     """Service for user notification preferences."""
@@ -12,12 +17,26 @@ class UserPreferenceService:
     def get_or_create_preferences(user) -> UserNotificationPreference:
         """
         Get or create notification preferences for a user.
+
+        The row is cached for PREFERENCES_CACHE_TIMEOUT seconds and dropped
+        by the post_save/post_delete signals.
         """
-        prefs, _ = UserNotificationPreference.objects.get_or_create(
-            user=user,
-        )
+        key = PREFERENCES_CACHE_KEY.format(user.id)
+        prefs = cache.get(key)
+        if prefs is None:
+            prefs, _ = UserNotificationPreference.objects.get_or_create(
+                user=user,
+            )
+            cache.set(key, prefs, PREFERENCES_CACHE_TIMEOUT)
         return prefs
 
+    @staticmethod
+    def invalidate_preferences(user_id) -> None:
+        """
+        Drop the cached preferences for a user.
+        """
+        cache.delete(PREFERENCES_CACHE_KEY.format(user_id))
+
     @staticmethod
     def update_preferences(
         user,
@@ -27,12 +46,16 @@ class UserPreferenceService:
         Update user notification preferences.
         """
         prefs = UserPreferenceService.get_or_create_preferences(user)
+        field_names = {field.attname for field in prefs._meta.concrete_fields}
 
+        update_fields = ["updated_at"]
         for key, value in kwargs.items():
             if hasattr(prefs, key):
                 setattr(prefs, key, value)
+                if key in field_names:
+                    update_fields.append(key)
 
-        prefs.save()
+        prefs.save(update_fields=update_fields)
         return prefs
 
     @staticmethod
@@ -47,7 +70,7 @@ class UserPreferenceService:
         prefs = UserPreferenceService.get_or_create_preferences(user)
         prefs.quiet_hours_start = start_time
         prefs.quiet_hours_end = end_time
-        prefs.save()
+        prefs.save(update_fields=["quiet_hours_start", "quiet_hours_end", "updated_at"])
 
         return prefs
 
@@ -2,6 +2,7 @@
 Service for push notification operations.
 """
 
+import json
 import logging
 
 from django.utils import timezone
@@ -10,6 +11,10 @@ from apps.notifications.models import Notification, PushSubscription
 
 logger = logging.getLogger(__name__)
 
+PUSH_DELIVERED = "delivered"
+PUSH_FAILED = "failed"
+PUSH_EXPIRED = "expired"
+
 
 class PushService:
     """Service for push notification operations."""
@@ -26,28 +31,16 @@ class PushService:
         """
         Register a new push subscription for a user.
         """
-        # Check if subscription already exists
-        existing = PushSubscription.objects.filter(
-            user=user,
-            endpoint=endpoint,
-        ).first()
-
-        if existing:
-            existing.p256dh_key = p256dh_key
-            existing.auth_key = auth_key
-            existing.device_name = device_name
-            existing.device_type = device_type
-            existing.is_active = True
-            existing.save()
-            return existing
-
-        subscription = PushSubscription.objects.create(
+        subscription, _ = PushSubscription.objects.update_or_create(
             user=user,
             endpoint=endpoint,
-            p256dh_key=p256dh_key,
-            auth_key=auth_key,
-            device_name=device_name,
-            device_type=device_type,
+            defaults={
+                "p256dh_key": p256dh_key,
+                "auth_key": auth_key,
+                "device_name": device_name,
+                "device_type": device_type,
+                "is_active": True,
+            },
         )
 
         logger.info(f"Push subscription registered for user {user.id}")
@@ -91,6 +84,46 @@ class PushService:
     ) -> bool:
         """
         Send a push notification to a subscription.
+        """
+        return PushService.send_push_to_subscriptions([subscription], notification) == 1
+
+    @staticmethod
+    def send_push_to_subscriptions(subscriptions, notification: Notification) -> int:
+        """
+        Send a push notification to several subscriptions.
+
+        Subscription bookkeeping is written with one UPDATE per outcome
+        rather than a save per subscription. Returns the number delivered.
+        """
+        # The payload is identical for every device, so serialize it once
+        payload = json.dumps(
+            {
+                "title": notification.subject,
+                "body": notification.body,
+                "url": notification.action_url,
+            }
+        )
+        delivered = []
+        expired = []
+
+        for subscription in subscriptions:
+            outcome = PushService._deliver(subscription, payload)
+            if outcome == PUSH_DELIVERED:
+                delivered.append(subscription.pk)
+            elif outcome == PUSH_EXPIRED:
+                expired.append(subscription.pk)
+
+        if delivered:
+            PushSubscription.objects.filter(pk__in=delivered).update(last_used_at=timezone.now())
+        if expired:
+            PushSubscription.objects.filter(pk__in=expired).update(is_active=False)
+
+        return len(delivered)
+
+    @staticmethod
+    def _deliver(subscription: PushSubscription, payload: str) -> str:
+        """
+        Deliver a serialized push payload to a single subscription endpoint.
         Placeholder - would use pywebpush or similar library.
         """
         try:
@@ -104,40 +137,29 @@ class PushService:
             #             "auth": subscription.auth_key,
             #         }
             #     },
-            #     data=json.dumps({
-            #         "title": notification.subject,
-            #         "body": notification.body,
-            #         "url": notification.action_url,
-            #     }),
+            #     data=payload,
             #     vapid_private_key=settings.VAPID_PRIVATE_KEY,
             #     vapid_claims={"sub": f"mailto:{settings.VAPID_EMAIL}"},
             # )
 
-            subscription.last_used_at = timezone.now()
-            subscription.save()
-
             logger.info(f"Push sent to subscription {subscription.id}")
-            return True
+            return PUSH_DELIVERED
 
         except ConnectionError as e:
             logger.error(f"Error de conexion enviando push a suscripcion {subscription.id}: {e}")
             # Errores de conexion son temporales, no desactivar
-            return False
+            return PUSH_FAILED
         except ValueError as e:
             logger.warning(f"Error de configuracion para push {subscription.id}: {e}")
-            return False
+            return PUSH_FAILED
         except Exception as e:
             error_str = str(e)
             # Verificar si el endpoint ya no es valido (410 Gone o 404 Not Found)
             if "410" in error_str or "404" in error_str:
                 logger.warning(f"Suscripcion {subscription.id} ya no es valida, desactivando: {e}")
-                subscription.is_active = False
-                subscription.save()
-            else:
-                logger.exception(
-                    f"Error inesperado enviando push a suscripcion {subscription.id}: {e}"
-                )
-            return False
+                return PUSH_EXPIRED
+            logger.exception(f"Error inesperado enviando push a suscripcion {subscription.id}: {e}")
+            return PUSH_FAILED
 
     @staticmethod
     def cleanup_inactive_subscriptions(days: int = 30) -> int:
@@ -2,8 +2,29 @@
 Service for notification template operations.
 """
 
+import re
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.template import Context, Engine
+
 from apps.notifications.models import NotificationTemplate
 
+TEMPLATE_CACHE_KEY = "nt:{}"
+TEMPLATE_LOOKUP_CACHE_KEY = "nt:name:{}:{}"
+TEMPLATE_CACHE_TIMEOUT = 3600
+
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+# Standalone engine for HTML bodies; autoescapes context values
+HTML_ENGINE = Engine()
+
+
+@lru_cache(maxsize=256)
+def _compile_html(source: str):
+    """Compile an HTML body once per distinct source string."""
+    return HTML_ENGINE.from_string(source)
+
 
 class NotificationTemplateService:
     """Service for notification template operations."""
@@ -12,7 +33,15 @@ class NotificationTemplateService:
     def get_template(name: str, channel: str = None) -> NotificationTemplate:
         """
         Get a notification template by name.
+
+        Lookups are cached per (name, channel) and dropped by the
+        post_save/post_delete signals.
         """
+        key = TEMPLATE_LOOKUP_CACHE_KEY.format(name, channel or "")
+        template = cache.get(key)
+        if template is not None:
+            return template
+
         queryset = NotificationTemplate.objects.filter(
             name=name,
             is_active=True,
@@ -21,7 +50,40 @@ class NotificationTemplateService:
         if channel:
             queryset = queryset.filter(channel=channel)
 
-        return queryset.first()
+        template = queryset.first()
+        if template is not None:
+            cache.set(key, template, TEMPLATE_CACHE_TIMEOUT)
+        return template
+
+    @staticmethod
+    def get_template_cached(pk: int) -> NotificationTemplate | None:
+        """
+        Get a notification template by primary key, served from the cache.
+
+        Entries are dropped by the post_save/post_delete signals.
+        """
+        key = TEMPLATE_CACHE_KEY.format(pk)
+        template = cache.get(key)
+        if template is None:
+            template = NotificationTemplate.objects.filter(pk=pk).first()
+            if template is not None:
+                cache.set(key, template, TEMPLATE_CACHE_TIMEOUT)
+        return template
+
+    @staticmethod
+    def invalidate_template(pk: int) -> None:
+        """
+        Drop a cached notification template.
+        """
+        cache.delete(TEMPLATE_CACHE_KEY.format(pk))
+
+    @staticmethod
+    def invalidate_template_lookup(name: str) -> None:
+        """
+        Drop the cached name lookups for a template, for every channel.
+        """
+        channels = ["", *NotificationTemplate.Channel.values]
+        cache.delete_many([TEMPLATE_LOOKUP_CACHE_KEY.format(name, channel) for channel in channels])
 
     @staticmethod
     def render_template(
@@ -36,7 +98,7 @@ class NotificationTemplateService:
         body = NotificationTemplateService._render_string(template.body, context)
         html_body = ""
         if template.html_body:
-            html_body = NotificationTemplateService._render_string(template.html_body, context)
+            html_body = NotificationTemplateService.render_html(template.html_body, context)
 
         return {
             "subject": subject,
@@ -44,16 +106,31 @@ class NotificationTemplateService:
             "html_body": html_body,
         }
 
+    @staticmethod
+    def render_html(template_str: str, context: dict) -> str:
+        """
+        Render an HTML body with the Django template language.
+
+        Compiled templates are reused across calls, so editing a template
+        simply compiles its new source on next use.
+        """
+        return _compile_html(template_str).render(Context(context))
+
     @staticmethod
     def _render_string(template_str: str, context: dict) -> str:
         """
         Render a template string with {{variable}} placeholders.
+
+        Placeholders missing from the context are left untouched.
         """
-        result = template_str
-        for key, value in context.items():
-            placeholder = "{{" + key + "}}"
-            result = result.replace(placeholder, str(value))
-        return result
+        if "{{" not in template_str:
+            return template_str
+
+        def replace(match):
+            key = match.group(1)
+            return str(context[key]) if key in context else match.group(0)
+
+        return PLACEHOLDER_RE.sub(replace, template_str)
 
     @staticmethod
     def get_templates_by_channel(channel: str):
@@ -0,0 +1,48 @@
+"""
+Signals for notifications app.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Notification, NotificationTemplate, UserNotificationPreference
+from .services.notification import NotificationService
+from .services.preferences import UserPreferenceService
+from .services.templates import NotificationTemplateService
+
+
+@receiver(pre_save, sender=NotificationTemplate)
+def track_template_rename(sender, instance, **kwargs):
+    """Remember the stored name so a rename also drops the old lookups."""
+    if not instance.pk:
+        return
+
+    instance._previous_name = (
+        NotificationTemplate.objects.filter(pk=instance.pk).values_list("name", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=NotificationTemplate)
+@receiver(post_delete, sender=NotificationTemplate)
+def invalidate_template_cache(sender, instance, **kwargs):
+    """Drop the cached copies of a template whenever it changes."""
+    NotificationTemplateService.invalidate_template(instance.pk)
+    NotificationTemplateService.invalidate_template_lookup(instance.name)
+
+    previous_name = getattr(instance, "_previous_name", None)
+    if previous_name and previous_name != instance.name:
+        NotificationTemplateService.invalidate_template_lookup(previous_name)
+
+
+@receiver(post_save, sender=UserNotificationPreference)
+@receiver(post_delete, sender=UserNotificationPreference)
+def invalidate_preferences_cache(sender, instance, **kwargs):
+    """Drop the cached preferences whenever they change."""
+    UserPreferenceService.invalidate_preferences(instance.user_id)
+
+
+@receiver(post_save, sender=Notification)
+def invalidate_unread_count_on_create(sender, instance, created, **kwargs):
+    """Drop the cached unread count when a user receives a notification."""
+    if created:
+        NotificationService.invalidate_unread_count(instance.user_id)
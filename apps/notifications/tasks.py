@@ -0,0 +1,51 @@
+"""
+Celery tasks for notifications app.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(ConnectionError, TimeoutError),
+    retry_backoff=2,
+    retry_backoff_max=600,
+    retry_jitter=True,
+    max_retries=3,
+)
+def send_notification_task(self, notification_id: int):
+    """
+    Send a pending notification through its channel.
+
+    Connection errors are retried by Celery with exponential backoff; the
+    last attempt records the failure on the notification instead.
+    """
+    from apps.notifications.models import Notification
+    from apps.notifications.services import NotificationService
+
+    try:
+        notification = Notification.objects.select_related(
+            "user", "user__notification_preferences", "template"
+        ).get(id=notification_id, status=Notification.Status.PENDING)
+    except Notification.DoesNotExist:
+        logger.warning(f"Pending notification {notification_id} not found")
+        return
+
+    NotificationService.send_notification(
+        notification,
+        raise_transient=self.request.retries < self.max_retries,
+    )
+
+
+@shared_task
+def delete_old_notifications(days: int = 90):
+    """
+    Periodic retention sweep for old read notifications.
+    """
+    from apps.notifications.services import NotificationService
+
+    return NotificationService.delete_old_notifications(days=days)
@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures for notifications tests.
+"""
+
+from django.core.cache import cache
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached counts do not leak."""
+    cache.clear()
+    yield
+    cache.clear()
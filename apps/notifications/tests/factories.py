@@ -7,10 +7,11 @@ Uses factory_boy to create test data for all notification models.
 from datetime import date, time, timedelta
 
 from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
 from django.utils import timezone
 
 import factory
-from factory.django import DjangoModelFactory
+from factory.django import DjangoModelFactory, mute_signals
 
 from apps.notifications.models import (
     Notification,
@@ -22,17 +23,33 @@ from apps.notifications.models import (
 User = get_user_model()
 
 
-class UserFactory(DjangoModelFactory):
+class BulkModelFactory(DjangoModelFactory):
+    """Base factory that can insert a batch of instances in one query."""
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        """
+        Build ``size`` instances and insert them in a single query.
+
+        Signals do not fire and SubFactory relations are not saved, so pass
+        related objects such as ``user`` explicitly.
+        """
+        return cls._meta.model.objects.bulk_create(cls.build_batch(size, **kwargs))
+
+
+class UserFactory(BulkModelFactory):
     """Factory for User model."""
 
     class Meta:
         model = User
-        django_get_or_create = ("email",)
 
     email = factory.Sequence(lambda n: f"notifuser{n}@test.com")
-    password = factory.PostGenerationMethodCall("set_password", "testpass123")
-    first_name = factory.Faker("first_name")
-    last_name = factory.Faker("last_name")
+    password = factory.django.Password("testpass123")
+    first_name = factory.Sequence(lambda n: f"First{n}")
+    last_name = factory.Sequence(lambda n: f"Last{n}")
     document_type = "CC"
     document_number = factory.Sequence(lambda n: f"{20000000 + n}")
     job_position = "Technician"
@@ -40,6 +57,23 @@ class UserFactory(DjangoModelFactory):
     hire_date = factory.LazyFunction(lambda: date.today() - timedelta(days=365))
     is_active = True
 
+    @classmethod
+    def create_bulk(cls, size, **kwargs):
+        """
+        Insert ``size`` users and their default preferences in two queries.
+
+        The post_save signal does not fire for bulk inserts, so the
+        preference rows it would have created are inserted here instead.
+        The rest of ``user_post_save`` is skipped: these users have no
+        UserPoints row, no course auto-enrollment and no audit entry, so
+        use ``UserFactory()`` where those matter.
+        """
+        users = super().create_bulk(size, **kwargs)
+        UserNotificationPreference.objects.bulk_create(
+            [UserNotificationPreference(user=user) for user in users]
+        )
+        return users
+
 
 class StaffUserFactory(UserFactory):
     """Factory for staff users."""
@@ -48,6 +82,19 @@ class StaffUserFactory(UserFactory):
     is_staff = True
 
 
+@mute_signals(post_save)
+class UserWithoutPreferencesFactory(UserFactory):
+    """
+    Factory for users created with every User post_save receiver muted.
+
+    No default UserNotificationPreference row is created, but neither are
+    the other rows ``user_post_save`` creates (UserPoints, profile course
+    auto-enrollment, audit entry). Use it only where those do not matter.
+    """
+
+    email = factory.Sequence(lambda n: f"notifnopref{n}@test.com")
+
+
 class AdminUserFactory(UserFactory):
     """Factory for admin users."""
 
@@ -56,17 +103,16 @@ class AdminUserFactory(UserFactory):
     is_superuser = True
 
 
-class NotificationTemplateFactory(DjangoModelFactory):
+class NotificationTemplateFactory(BulkModelFactory):
     """Factory for NotificationTemplate model."""
 
     class Meta:
         model = NotificationTemplate
-        django_get_or_create = ("name",)
 
     name = factory.Sequence(lambda n: f"Template {n}")
-    description = factory.Faker("sentence")
+    description = factory.Sequence(lambda n: f"Template description {n}")
     subject = factory.Sequence(lambda n: f"Test Subject {n}")
-    body = factory.Faker("paragraph")
+    body = factory.Sequence(lambda n: f"Body content {n}")
     html_body = factory.LazyAttribute(lambda obj: f"<p>{obj.body}</p>")
     channel = NotificationTemplate.Channel.IN_APP
     is_active = True
@@ -96,7 +142,7 @@ class SMSTemplateFactory(NotificationTemplateFactory):
     name = factory.Sequence(lambda n: f"SMS Template {n}")
     channel = NotificationTemplate.Channel.SMS
     html_body = ""
-    body = factory.Faker("text", max_nb_chars=160)
+    body = factory.Sequence(lambda n: f"SMS body {n}")
 
 
 class InactiveTemplateFactory(NotificationTemplateFactory):
@@ -106,7 +152,7 @@ class InactiveTemplateFactory(NotificationTemplateFactory):
     is_active = False
 
 
-class NotificationFactory(DjangoModelFactory):
+class NotificationFactory(BulkModelFactory):
     """Factory for Notification model."""
 
     class Meta:
@@ -116,7 +162,7 @@ class NotificationFactory(DjangoModelFactory):
     template = None
     channel = NotificationTemplate.Channel.IN_APP
     subject = factory.Sequence(lambda n: f"Notification Subject {n}")
-    body = factory.Faker("paragraph")
+    body = factory.Sequence(lambda n: f"Body content {n}")
     status = Notification.Status.PENDING
     priority = Notification.Priority.NORMAL
     action_url = ""
@@ -139,18 +185,24 @@ class SentNotificationFactory(NotificationFactory):
 class DeliveredNotificationFactory(NotificationFactory):
     """Factory for delivered notifications."""
 
+    class Params:
+        now = factory.LazyFunction(timezone.now)
+
     status = Notification.Status.DELIVERED
-    sent_at = factory.LazyFunction(lambda: timezone.now() - timedelta(minutes=5))
-    delivered_at = factory.LazyFunction(timezone.now)
+    sent_at = factory.LazyAttribute(lambda obj: obj.now - timedelta(minutes=5))
+    delivered_at = factory.SelfAttribute("now")
 
 
 class ReadNotificationFactory(NotificationFactory):
     """Factory for read notifications."""
 
+    class Params:
+        now = factory.LazyFunction(timezone.now)
+
     status = Notification.Status.READ
-    sent_at = factory.LazyFunction(lambda: timezone.now() - timedelta(hours=1))
-    delivered_at = factory.LazyFunction(lambda: timezone.now() - timedelta(minutes=30))
-    read_at = factory.LazyFunction(timezone.now)
+    sent_at = factory.LazyAttribute(lambda obj: obj.now - timedelta(hours=1))
+    delivered_at = factory.LazyAttribute(lambda obj: obj.now - timedelta(minutes=30))
+    read_at = factory.SelfAttribute("now")
 
 
 class FailedNotificationFactory(NotificationFactory):
@@ -203,14 +255,15 @@ class UserNotificationPreferenceFactory(DjangoModelFactory):
     """Factory for UserNotificationPreference model.
 
     Note: When a User is created, a signal automatically creates
-    UserNotificationPreference with default values. This factory
-    gets the existing preference and updates it with the specified values.
+    UserNotificationPreference with default values. A given user's
+    existing preference is updated in place; without one, the user is
+    built with signals muted and the preference row inserted directly.
     """
 
     class Meta:
         model = UserNotificationPreference
 
-    user = factory.SubFactory(UserFactory)
+    user = factory.SubFactory(UserWithoutPreferencesFactory)
     email_enabled = True
     push_enabled = True
     sms_enabled = False
@@ -225,19 +278,11 @@ class UserNotificationPreferenceFactory(DjangoModelFactory):
     quiet_hours_end = None
 
     @classmethod
-    def _create(cls, model_class, *args, **kwargs):
+    def _create(cls, model_class, *_args, **kwargs):
         """Override create to update existing preferences created by signal."""
-        user = kwargs.pop("user", None)
-        if user:
-            # Get existing preference (created by signal) or create new one
-            obj, created = model_class.objects.get_or_create(user=user)
-            # Update all attributes from kwargs
-            for key, value in kwargs.items():
-                setattr(obj, key, value)
-            obj.save()
-            return obj
-        # If no user, use default factory behavior (will create new user)
-        return super()._create(model_class, *args, **kwargs)
+        user = kwargs.pop("user")
+        obj, _ = model_class.objects.update_or_create(user=user, defaults=kwargs)
+        return obj
 
 
 class AllChannelsEnabledPreferenceFactory(UserNotificationPreferenceFactory):
@@ -276,7 +321,7 @@ class MinimalNotificationsPreferenceFactory(UserNotificationPreferenceFactory):
     lesson_learned_updates = False
 
 
-class PushSubscriptionFactory(DjangoModelFactory):
+class PushSubscriptionFactory(BulkModelFactory):
     """Factory for PushSubscription model."""
 
     class Meta:
@@ -290,7 +335,7 @@ class PushSubscriptionFactory(DjangoModelFactory):
         )
     )
     auth_key = factory.Sequence(lambda n: f"tBHItJI5svbpez7KI4CCXg{n}")
-    device_name = factory.Faker("user_agent")
+    device_name = factory.Sequence(lambda n: f"Device {n}")
     device_type = factory.Iterator(["mobile", "desktop", "tablet"])
     is_active = True
 
@@ -8,8 +8,12 @@ Covers:
 - PushSubscriptionViewSet
 """
 
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+import factory
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -38,29 +42,104 @@ from .factories import (
     UserNotificationPreferenceFactory,
 )
 
+User = get_user_model()
 
-@pytest.fixture
-def api_client():
-    """Return an API client."""
+READ = Notification.Status.READ
+NORMAL = Notification.Priority.NORMAL
+URGENT = Notification.Priority.URGENT
+
+# Resolved once at import; detail URLs are built from the list URLs.
+NOTIFICATION_LIST_URL = reverse("notifications_api:notification-list")
+MARK_ALL_READ_URL = reverse("notifications_api:notification-mark-all-read")
+MARK_SELECTED_READ_URL = reverse("notifications_api:notification-mark-selected-read")
+SEND_URL = reverse("notifications_api:notification-send")
+UNREAD_COUNT_URL = reverse("notifications_api:notification-unread-count")
+TEMPLATE_LIST_URL = reverse("notifications_api:template-list")
+PREFERENCE_LIST_URL = reverse("notifications_api:preference-list")
+UPDATE_PREFERENCES_URL = reverse("notifications_api:preference-update-preferences")
+PUSH_SUBSCRIPTION_LIST_URL = reverse("notifications_api:push-subscription-list")
+SUBSCRIBE_URL = reverse("notifications_api:push-subscription-subscribe")
+UNSUBSCRIBE_URL = reverse("notifications_api:push-subscription-unsubscribe")
+
+
+def notification_url(pk):
+    """Return the detail URL of a notification."""
+    return f"{NOTIFICATION_LIST_URL}{pk}/"
+
+
+def mark_read_url(pk):
+    """Return the mark-read URL of a notification."""
+    return f"{NOTIFICATION_LIST_URL}{pk}/mark_read/"
+
+
+def template_url(pk):
+    """Return the detail URL of a notification template."""
+    return f"{TEMPLATE_LIST_URL}{pk}/"
+
+
+def push_subscription_url(pk):
+    """Return the detail URL of a push subscription."""
+    return f"{PUSH_SUBSCRIPTION_LIST_URL}{pk}/"
+
+
+@pytest.fixture(scope="module")
+def shared_api_client():
+    """Build one API client per module; tests borrow it via ``api_client``."""
     return APIClient()
 
 
 @pytest.fixture
-def user():
-    """Create and return a regular user."""
-    return UserFactory()
+def api_client(shared_api_client):
+    """Return an API client, reset to anonymous after the test."""
+    yield shared_api_client
+    shared_api_client.force_authenticate(user=None)
+    shared_api_client.credentials()
+    shared_api_client.cookies.clear()
+
+
+@pytest.fixture(scope="module")
+def module_user_ids(django_db_setup, django_db_blocker):
+    """
+    Create the shared API users once per module.
+
+    Each test still runs in its own transaction, so changes made through
+    these users are rolled back; the fixtures below re-read fresh
+    instances so no in-memory state leaks between tests.
+    """
+    with django_db_blocker.unblock():
+        user_ids = {
+            "user": UserFactory().pk,
+            "staff_user": StaffUserFactory().pk,
+            "admin_user": AdminUserFactory().pk,
+            "other_user": UserFactory().pk,
+        }
+    yield user_ids
+    with django_db_blocker.unblock():
+        User.objects.filter(pk__in=user_ids.values()).delete()
 
 
 @pytest.fixture
-def staff_user():
-    """Create and return a staff user."""
-    return StaffUserFactory()
+def user(db, module_user_ids):
+    """Return a regular user."""
+    return User.objects.get(pk=module_user_ids["user"])
 
 
 @pytest.fixture
-def admin_user():
-    """Create and return an admin user."""
-    return AdminUserFactory()
+def staff_user(db, module_user_ids):
+    """Return a staff user."""
+    return User.objects.get(pk=module_user_ids["staff_user"])
+
+
+@pytest.fixture
+def admin_user(db, module_user_ids):
+    """Return an admin user."""
+    return User.objects.get(pk=module_user_ids["admin_user"])
+
+
+@pytest.fixture
+def other_user(db, module_user_ids):
+    """Return a second regular user who does not own the test data."""
+    return User.objects.get(pk=module_user_ids["other_user"])
 
 
 @pytest.fixture
@@ -95,28 +174,26 @@ class TestNotificationList:
 
     def test_list_notifications_unauthenticated(self, api_client):
         """Test that unauthenticated users cannot list notifications."""
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_list_notifications_empty(self, authenticated_client):
         """Test listing notifications when user has none."""
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         results = response.data["results"] if isinstance(response.data, dict) else response.data
         assert len(results) == 0
 
-    def test_list_own_notifications(self, authenticated_client, user):
+    def test_list_own_notifications(self, authenticated_client, user, other_user):
         """Test listing user's own notifications."""
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
-        other_user = UserFactory()
+        NotificationFactory.create_bulk(2, user=user)
         NotificationFactory(user=other_user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -128,7 +205,7 @@ class TestNotificationList:
         old_notification = NotificationFactory(user=user)
         new_notification = NotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url)
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -141,7 +218,7 @@ class TestNotificationList:
         ReadNotificationFactory(user=user)
         SentNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url, {"status": "sent"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -155,7 +232,7 @@ class TestNotificationList:
         PushNotificationFactory(user=user)
         EmailNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url, {"channel": "email"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -166,7 +243,7 @@ class TestNotificationList:
         NotificationFactory(user=user)
         ReadNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url, {"unread": "true"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -174,25 +251,49 @@ class TestNotificationList:
 
     def test_list_notifications_filter_by_priority(self, authenticated_client, user):
         """Test filtering notifications by priority."""
-        NotificationFactory(user=user, priority=Notification.Priority.NORMAL)
+        NotificationFactory(user=user, priority=NORMAL)
         HighPriorityNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url, {"priority": "high"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
         assert len(results) == 1
         assert results[0]["priority"] == "high"
 
+    def test_list_notifications_filter_unknown_value(self, authenticated_client, user):
+        """Test that an unknown filter value matches no notifications."""
+        NotificationFactory(user=user)
+
+        url = NOTIFICATION_LIST_URL
+        response = authenticated_client.get(url, {"status": "unread"})
+
+        results = response.data["results"] if isinstance(response.data, dict) else response.data
+        assert len(results) == 0
+
+    def test_list_notifications_query_count_is_constant(self, authenticated_client, user):
+        """Test that listing does not issue a query per notification or template."""
+        NotificationFactory(user=user, template=NotificationTemplateFactory())
+
+        with CaptureQueriesContext(connection) as single:
+            authenticated_client.get(NOTIFICATION_LIST_URL)
+
+        NotificationFactory.create_bulk(3, user=user, template=NotificationTemplateFactory())
+
+        with CaptureQueriesContext(connection) as several:
+            response = authenticated_client.get(NOTIFICATION_LIST_URL)
+
+        assert response.data["count"] == 4
+        assert len(several) == len(single)
+
     def test_staff_can_filter_by_user(self, staff_client, staff_user):
         """Test that staff can filter notifications by user."""
         user1 = UserFactory()
         user2 = UserFactory()
-        NotificationFactory(user=user1)
-        NotificationFactory(user=user1)
+        NotificationFactory.create_bulk(2, user=user1)
         NotificationFactory(user=user2)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = staff_client.get(url, {"user": user1.id})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -207,25 +308,18 @@ class TestNotificationDetail:
         """Test getting notification detail."""
         notification = NotificationFactory(user=user)
 
-        url = reverse(
-            "notifications_api:notification-detail",
-            args=[notification.id],
-        )
+        url = notification_url(notification.id)
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == notification.id
         assert response.data["subject"] == notification.subject
 
-    def test_cannot_get_other_user_notification(self, authenticated_client):
+    def test_cannot_get_other_user_notification(self, authenticated_client, other_user):
         """Test that users cannot get other users' notifications."""
-        other_user = UserFactory()
         notification = NotificationFactory(user=other_user)
 
-        url = reverse(
-            "notifications_api:notification-detail",
-            args=[notification.id],
-        )
+        url = notification_url(notification.id)
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -239,54 +333,40 @@ class TestNotificationMarkRead:
         """Test marking a notification as read."""
         notification = SentNotificationFactory(user=user)
 
-        url = reverse(
-            "notifications_api:notification-mark-read",
-            args=[notification.id],
-        )
+        url = mark_read_url(notification.id)
         response = authenticated_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
         notification.refresh_from_db()
         assert notification.read_at is not None
-        assert notification.status == Notification.Status.READ
+        assert notification.status == READ
 
     def test_mark_notification_read_idempotent(self, authenticated_client, user):
         """Test that marking as read is idempotent."""
         notification = ReadNotificationFactory(user=user)
         original_read_at = notification.read_at
 
-        url = reverse(
-            "notifications_api:notification-mark-read",
-            args=[notification.id],
-        )
+        url = mark_read_url(notification.id)
         response = authenticated_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
         notification.refresh_from_db()
         assert notification.read_at == original_read_at
 
-    def test_cannot_mark_other_user_notification_read(self, authenticated_client):
+    def test_cannot_mark_other_user_notification_read(self, authenticated_client, other_user):
         """Test that users cannot mark other users' notifications as read."""
-        other_user = UserFactory()
         notification = NotificationFactory(user=other_user)
 
-        url = reverse(
-            "notifications_api:notification-mark-read",
-            args=[notification.id],
-        )
+        url = mark_read_url(notification.id)
         response = authenticated_client.post(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_staff_can_mark_any_notification_read(self, staff_client):
+    def test_staff_can_mark_any_notification_read(self, staff_client, other_user):
         """Test that staff can mark any notification as read."""
-        other_user = UserFactory()
         notification = SentNotificationFactory(user=other_user)
 
-        url = reverse(
-            "notifications_api:notification-mark-read",
-            args=[notification.id],
-        )
+        url = mark_read_url(notification.id)
         response = staff_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -298,11 +378,9 @@ class TestNotificationMarkAllRead:
 
     def test_mark_all_read(self, authenticated_client, user):
         """Test marking all notifications as read."""
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(3, user=user)
 
-        url = reverse("notifications_api:notification-mark-all-read")
+        url = MARK_ALL_READ_URL
         response = authenticated_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -316,19 +394,20 @@ class TestNotificationMarkAllRead:
         NotificationFactory(user=user)
         ReadNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-mark-all-read")
+        url = MARK_ALL_READ_URL
         response = authenticated_client.post(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["updated"] == 1
 
-    def test_mark_all_read_does_not_affect_other_users(self, authenticated_client, user):
+    def test_mark_all_read_does_not_affect_other_users(
+        self, authenticated_client, user, other_user
+    ):
         """Test that mark all read doesn't affect other users' notifications."""
-        other_user = UserFactory()
         NotificationFactory(user=user)
         NotificationFactory(user=other_user)
 
-        url = reverse("notifications_api:notification-mark-all-read")
+        url = MARK_ALL_READ_URL
         authenticated_client.post(url)
 
         other_unread = Notification.objects.filter(user=other_user, read_at__isnull=True).count()
@@ -341,11 +420,9 @@ class TestNotificationMarkSelectedRead:
 
     def test_mark_selected_read(self, authenticated_client, user):
         """Test marking selected notifications as read."""
-        n1 = NotificationFactory(user=user)
-        n2 = NotificationFactory(user=user)
-        n3 = NotificationFactory(user=user)
+        n1, n2, n3 = NotificationFactory.create_bulk(3, user=user)
 
-        url = reverse("notifications_api:notification-mark-selected-read")
+        url = MARK_SELECTED_READ_URL
         response = authenticated_client.post(
             url,
             {"notification_ids": [n1.id, n2.id]},
@@ -354,16 +431,18 @@ class TestNotificationMarkSelectedRead:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["updated"] == 2
+        assert sorted(response.data["ids"]) == sorted([n1.id, n2.id])
 
-        n3.refresh_from_db()
-        assert n3.read_at is None
+        read_at = dict(Notification.objects.filter(user=user).values_list("id", "read_at"))
+        assert read_at[n1.id] is not None
+        assert read_at[n2.id] is not None
+        assert read_at[n3.id] is None
 
     def test_mark_selected_read_with_mark_all(self, authenticated_client, user):
         """Test mark selected with mark_all flag."""
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(2, user=user)
 
-        url = reverse("notifications_api:notification-mark-selected-read")
+        url = MARK_SELECTED_READ_URL
         response = authenticated_client.post(
             url,
             {"mark_all": True},
@@ -380,11 +459,10 @@ class TestNotificationUnreadCount:
 
     def test_get_unread_count(self, authenticated_client, user):
         """Test getting unread notification count."""
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(2, user=user)
         ReadNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-unread-count")
+        url = UNREAD_COUNT_URL
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -394,12 +472,31 @@ class TestNotificationUnreadCount:
         """Test unread count when all are read."""
         ReadNotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-unread-count")
+        url = UNREAD_COUNT_URL
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 0
 
+    def test_unread_count_refreshed_after_mark_all_read(self, authenticated_client, user):
+        """Test that marking all as read invalidates the cached count."""
+        NotificationFactory(user=user)
+        url = UNREAD_COUNT_URL
+        assert authenticated_client.get(url).data["count"] == 1
+
+        authenticated_client.post(MARK_ALL_READ_URL)
+
+        assert authenticated_client.get(url).data["count"] == 0
+
+    def test_unread_count_refreshed_after_new_notification(self, authenticated_client, user):
+        """Test that a new notification invalidates the cached count."""
+        url = UNREAD_COUNT_URL
+        assert authenticated_client.get(url).data["count"] == 0
+
+        NotificationFactory(user=user)
+
+        assert authenticated_client.get(url).data["count"] == 1
+
 
 @pytest.mark.django_db
 class TestNotificationSend:
@@ -407,7 +504,7 @@ class TestNotificationSend:
 
     def test_send_notification_requires_staff(self, authenticated_client, user):
         """Test that only staff can send notifications."""
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = authenticated_client.post(
             url,
             {"user_id": user.id, "subject": "Test", "body": "Test"},
@@ -420,7 +517,7 @@ class TestNotificationSend:
         """Test sending notification as staff."""
         target_user = UserFactory()
 
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = staff_client.post(
             url,
             {
@@ -439,10 +536,10 @@ class TestNotificationSend:
 
     def test_send_notification_to_multiple_users(self, staff_client):
         """Test sending notification to multiple users."""
-        users = [UserFactory() for _ in range(3)]
+        users = UserFactory.create_bulk(3)
         user_ids = [u.id for u in users]
 
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = staff_client.post(
             url,
             {
@@ -461,7 +558,7 @@ class TestNotificationSend:
         template = NotificationTemplateFactory()
         target_user = UserFactory()
 
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = staff_client.post(
             url,
             {
@@ -482,7 +579,7 @@ class TestNotificationSend:
         """Test sending notification with priority."""
         target_user = UserFactory()
 
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = staff_client.post(
             url,
             {
@@ -497,11 +594,11 @@ class TestNotificationSend:
         assert response.status_code == status.HTTP_201_CREATED
 
         notification = Notification.objects.get(user=target_user)
-        assert notification.priority == Notification.Priority.URGENT
+        assert notification.priority == URGENT
 
     def test_send_notification_requires_user(self, staff_client):
         """Test that sending requires at least one user."""
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = staff_client.post(
             url,
             {"subject": "Test", "body": "Test"},
@@ -522,17 +619,16 @@ class TestNotificationTemplateList:
 
     def test_list_templates_unauthenticated(self, api_client):
         """Test that unauthenticated users cannot list templates."""
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_list_templates(self, authenticated_client):
         """Test listing templates."""
-        NotificationTemplateFactory()
-        NotificationTemplateFactory()
+        NotificationTemplateFactory.create_bulk(2)
 
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -541,11 +637,10 @@ class TestNotificationTemplateList:
 
     def test_list_templates_filter_by_channel(self, authenticated_client):
         """Test filtering templates by channel."""
-        EmailTemplateFactory()
-        EmailTemplateFactory()
+        EmailTemplateFactory.create_bulk(2)
         PushTemplateFactory()
 
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.get(url, {"channel": "email"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -556,7 +651,7 @@ class TestNotificationTemplateList:
         NotificationTemplateFactory(is_active=True)
         NotificationTemplateFactory(is_active=False)
 
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.get(url, {"active": "true"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -567,7 +662,7 @@ class TestNotificationTemplateList:
         NotificationTemplateFactory(name="Welcome Email")
         NotificationTemplateFactory(name="Password Reset")
 
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.get(url, {"search": "Welcome"})
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -581,7 +676,7 @@ class TestNotificationTemplateCreate:
 
     def test_create_template(self, authenticated_client):
         """Test creating a template."""
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.post(
             url,
             {
@@ -599,7 +694,7 @@ class TestNotificationTemplateCreate:
 
     def test_create_template_with_html(self, authenticated_client):
         """Test creating a template with HTML body."""
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.post(
             url,
             {
@@ -619,7 +714,7 @@ class TestNotificationTemplateCreate:
         """Test that duplicate template names fail."""
         NotificationTemplateFactory(name="Existing Template")
 
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.post(
             url,
             {
@@ -642,7 +737,7 @@ class TestNotificationTemplateUpdate:
         """Test updating a template."""
         template = NotificationTemplateFactory()
 
-        url = reverse("notifications_api:template-detail", args=[template.id])
+        url = template_url(template.id)
         response = authenticated_client.patch(
             url,
             {"subject": "Updated Subject"},
@@ -657,7 +752,7 @@ class TestNotificationTemplateUpdate:
         """Test deactivating a template."""
         template = NotificationTemplateFactory(is_active=True)
 
-        url = reverse("notifications_api:template-detail", args=[template.id])
+        url = template_url(template.id)
         response = authenticated_client.patch(
             url,
             {"is_active": False},
@@ -677,7 +772,7 @@ class TestNotificationTemplateDelete:
         """Test deleting a template."""
         template = NotificationTemplateFactory()
 
-        url = reverse("notifications_api:template-detail", args=[template.id])
+        url = template_url(template.id)
         response = authenticated_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -707,7 +802,7 @@ class TestUserNotificationPreferences:
         # Preferences should already exist due to signal
         assert UserNotificationPreference.objects.filter(user=new_user).exists()
 
-        url = reverse("notifications_api:preference-list")
+        url = PREFERENCE_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -724,7 +819,7 @@ class TestUserNotificationPreferences:
         api_client.force_authenticate(user=new_user)
         UserNotificationPreferenceFactory(user=new_user, email_enabled=False)
 
-        url = reverse("notifications_api:preference-list")
+        url = PREFERENCE_LIST_URL
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -734,7 +829,7 @@ class TestUserNotificationPreferences:
         """Test updating preferences."""
         UserNotificationPreferenceFactory(user=user)
 
-        url = reverse("notifications_api:preference-update-preferences")
+        url = UPDATE_PREFERENCES_URL
         response = authenticated_client.patch(
             url,
             {
@@ -756,7 +851,7 @@ class TestUserNotificationPreferences:
             push_enabled=True,
         )
 
-        url = reverse("notifications_api:preference-update-preferences")
+        url = UPDATE_PREFERENCES_URL
         response = authenticated_client.patch(
             url,
             {"email_enabled": False},
@@ -771,7 +866,7 @@ class TestUserNotificationPreferences:
         """Test updating quiet hours."""
         UserNotificationPreferenceFactory(user=user)
 
-        url = reverse("notifications_api:preference-update-preferences")
+        url = UPDATE_PREFERENCES_URL
         response = authenticated_client.patch(
             url,
             {
@@ -795,14 +890,12 @@ class TestUserNotificationPreferences:
 class TestPushSubscriptionList:
     """Tests for listing push subscriptions."""
 
-    def test_list_subscriptions(self, authenticated_client, user):
+    def test_list_subscriptions(self, authenticated_client, user, other_user):
         """Test listing user's push subscriptions."""
-        PushSubscriptionFactory(user=user)
-        PushSubscriptionFactory(user=user)
-        other_user = UserFactory()
+        PushSubscriptionFactory.create_bulk(2, user=user)
         PushSubscriptionFactory(user=other_user)
 
-        url = reverse("notifications_api:push-subscription-list")
+        url = PUSH_SUBSCRIPTION_LIST_URL
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
@@ -816,7 +909,7 @@ class TestPushSubscriptionSubscribe:
 
     def test_subscribe(self, authenticated_client, user):
         """Test subscribing to push notifications."""
-        url = reverse("notifications_api:push-subscription-subscribe")
+        url = SUBSCRIBE_URL
         response = authenticated_client.post(
             url,
             {
@@ -840,7 +933,7 @@ class TestPushSubscriptionSubscribe:
             device_name="Old Name",
         )
 
-        url = reverse("notifications_api:push-subscription-subscribe")
+        url = SUBSCRIBE_URL
         response = authenticated_client.post(
             url,
             {
@@ -869,7 +962,7 @@ class TestPushSubscriptionUnsubscribe:
             endpoint="https://push.example.com/to-unsubscribe",
         )
 
-        url = reverse("notifications_api:push-subscription-unsubscribe")
+        url = UNSUBSCRIBE_URL
         response = authenticated_client.post(
             url,
             {"endpoint": "https://push.example.com/to-unsubscribe"},
@@ -883,14 +976,14 @@ class TestPushSubscriptionUnsubscribe:
 
     def test_unsubscribe_requires_endpoint(self, authenticated_client):
         """Test that unsubscribing requires endpoint."""
-        url = reverse("notifications_api:push-subscription-unsubscribe")
+        url = UNSUBSCRIBE_URL
         response = authenticated_client.post(url, {}, format="json")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     def test_unsubscribe_nonexistent(self, authenticated_client, user):
         """Test unsubscribing from nonexistent subscription."""
-        url = reverse("notifications_api:push-subscription-unsubscribe")
+        url = UNSUBSCRIBE_URL
         response = authenticated_client.post(
             url,
             {"endpoint": "https://push.example.com/nonexistent"},
@@ -907,7 +1000,7 @@ class TestPushSubscriptionCreate:
 
     def test_create_subscription(self, authenticated_client, user):
         """Test creating a push subscription."""
-        url = reverse("notifications_api:push-subscription-list")
+        url = PUSH_SUBSCRIPTION_LIST_URL
         response = authenticated_client.post(
             url,
             {
@@ -923,6 +1016,45 @@ class TestPushSubscriptionCreate:
         subscription = PushSubscription.objects.get(user=user)
         assert subscription.endpoint == "https://push.example.com/create"
 
+    def test_create_subscription_reuses_existing_endpoint(self, authenticated_client, user):
+        """Test creating a subscription for a known endpoint updates it instead of failing."""
+        existing = PushSubscriptionFactory(
+            user=user,
+            endpoint="https://push.example.com/duplicate",
+            device_name="Old Name",
+        )
+
+        response = authenticated_client.post(
+            PUSH_SUBSCRIPTION_LIST_URL,
+            {
+                "endpoint": "https://push.example.com/duplicate",
+                "p256dh_key": "p256dh_key_value",
+                "auth_key": "auth_key_value",
+                "device_name": "New Name",
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["id"] == existing.id
+        assert PushSubscription.objects.filter(user=user).count() == 1
+        existing.refresh_from_db()
+        assert existing.device_name == "New Name"
+
+    def test_update_subscription_to_existing_endpoint_rejected(self, authenticated_client, user):
+        """Test moving a subscription onto another of the user's endpoints returns 400."""
+        PushSubscriptionFactory(user=user, endpoint="https://push.example.com/taken")
+        subscription = PushSubscriptionFactory(user=user)
+
+        response = authenticated_client.patch(
+            push_subscription_url(subscription.id),
+            {"endpoint": "https://push.example.com/taken"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "endpoint" in response.data
+
 
 @pytest.mark.django_db
 class TestPushSubscriptionDelete:
@@ -932,24 +1064,17 @@ class TestPushSubscriptionDelete:
         """Test deleting a push subscription."""
         subscription = PushSubscriptionFactory(user=user)
 
-        url = reverse(
-            "notifications_api:push-subscription-detail",
-            args=[subscription.id],
-        )
+        url = push_subscription_url(subscription.id)
         response = authenticated_client.delete(url)
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not PushSubscription.objects.filter(pk=subscription.pk).exists()
 
-    def test_cannot_delete_other_user_subscription(self, authenticated_client):
+    def test_cannot_delete_other_user_subscription(self, authenticated_client, other_user):
         """Test that users cannot delete other users' subscriptions."""
-        other_user = UserFactory()
         subscription = PushSubscriptionFactory(user=other_user)
 
-        url = reverse(
-            "notifications_api:push-subscription-detail",
-            args=[subscription.id],
-        )
+        url = push_subscription_url(subscription.id)
         response = authenticated_client.delete(url)
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -967,10 +1092,10 @@ class TestNotificationPermissions:
     def test_unauthenticated_access_denied(self, api_client):
         """Test that unauthenticated users are denied access."""
         endpoints = [
-            reverse("notifications_api:notification-list"),
-            reverse("notifications_api:template-list"),
-            reverse("notifications_api:preference-list"),
-            reverse("notifications_api:push-subscription-list"),
+            NOTIFICATION_LIST_URL,
+            TEMPLATE_LIST_URL,
+            PREFERENCE_LIST_URL,
+            PUSH_SUBSCRIPTION_LIST_URL,
         ]
 
         for endpoint in endpoints:
@@ -979,7 +1104,7 @@ class TestNotificationPermissions:
 
     def test_regular_user_cannot_send_notifications(self, authenticated_client, user):
         """Test that regular users cannot send notifications."""
-        url = reverse("notifications_api:notification-send")
+        url = SEND_URL
         response = authenticated_client.post(
             url,
             {"user_id": user.id, "subject": "Test", "body": "Test"},
@@ -990,12 +1115,10 @@ class TestNotificationPermissions:
 
     def test_staff_can_access_all_notifications(self, staff_client):
         """Test that staff can see all users' notifications."""
-        user1 = UserFactory()
-        user2 = UserFactory()
-        NotificationFactory(user=user1)
-        NotificationFactory(user=user2)
+        users = UserFactory.create_bulk(2)
+        NotificationFactory.create_bulk(2, user=factory.Iterator(users))
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = staff_client.get(url)
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -1015,7 +1138,7 @@ class TestNotificationSerializer:
         """Test that list serializer returns correct fields."""
         NotificationFactory(user=user)
 
-        url = reverse("notifications_api:notification-list")
+        url = NOTIFICATION_LIST_URL
         response = authenticated_client.get(url)
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -1038,10 +1161,7 @@ class TestNotificationSerializer:
         """Test that detail serializer returns all fields."""
         notification = NotificationFactory(user=user)
 
-        url = reverse(
-            "notifications_api:notification-detail",
-            args=[notification.id],
-        )
+        url = notification_url(notification.id)
         response = authenticated_client.get(url)
 
         expected_fields = [
@@ -1073,7 +1193,7 @@ class TestTemplateSerializer:
         """Test that template serializer returns correct fields."""
         NotificationTemplateFactory()
 
-        url = reverse("notifications_api:template-list")
+        url = TEMPLATE_LIST_URL
         response = authenticated_client.get(url)
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
@@ -1103,7 +1223,7 @@ class TestPreferenceSerializer:
         """Test that preference serializer returns correct fields."""
         UserNotificationPreferenceFactory(user=user)
 
-        url = reverse("notifications_api:preference-list")
+        url = PREFERENCE_LIST_URL
         response = authenticated_client.get(url)
 
         expected_fields = [
@@ -1134,7 +1254,7 @@ class TestPushSubscriptionSerializer:
         """Test that subscription serializer returns correct fields."""
         PushSubscriptionFactory(user=user)
 
-        url = reverse("notifications_api:push-subscription-list")
+        url = PUSH_SUBSCRIPTION_LIST_URL
         response = authenticated_client.get(url)
 
         results = response.data["results"] if isinstance(response.data, dict) else response.data
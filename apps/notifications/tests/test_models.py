@@ -232,8 +232,7 @@ class TestNotification:
     def test_notification_user_cascade_delete(self):
         """Test that notifications are deleted when user is deleted."""
         user = UserFactory()
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(2, user=user)
 
         user_id = user.id
         user.delete()
@@ -261,6 +260,14 @@ class TestNotification:
 
         assert list(notifications) == [new_notification, old_notification]
 
+    def test_unread_manager_returns_notifications_without_read_at(self):
+        """Test that the unread manager method filters on read_at."""
+        user = UserFactory()
+        unread = SentNotificationFactory(user=user)
+        ReadNotificationFactory(user=user)
+
+        assert list(Notification.objects.unread().filter(user=user)) == [unread]
+
 
 @pytest.mark.django_db
 class TestUserNotificationPreference:
@@ -477,9 +484,7 @@ class TestNotificationRelationships:
     def test_user_notifications_relationship(self):
         """Test user to notifications relationship."""
         user = UserFactory()
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(3, user=user)
 
         assert user.notifications.count() == 3
 
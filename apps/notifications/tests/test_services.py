@@ -88,6 +88,42 @@ class TestNotificationTemplateService:
 
         assert result is None
 
+    def test_get_template_refreshes_after_save(self):
+        """Test cached name lookups are dropped when the template changes."""
+        template = NotificationTemplateFactory(name="cached_template", subject="Antes")
+        assert NotificationTemplateService.get_template("cached_template").subject == "Antes"
+
+        template.subject = "Despues"
+        template.save()
+
+        assert NotificationTemplateService.get_template("cached_template").subject == "Despues"
+
+    def test_get_template_forgets_old_name_after_rename(self):
+        """Test a renamed template is no longer served under its old name."""
+        template = NotificationTemplateFactory(
+            name="old_name",
+            channel=NotificationTemplate.Channel.EMAIL,
+        )
+        assert NotificationTemplateService.get_template("old_name") == template
+        assert (
+            NotificationTemplateService.get_template(
+                "old_name", channel=NotificationTemplate.Channel.EMAIL
+            )
+            == template
+        )
+
+        template.name = "new_name"
+        template.save()
+
+        assert NotificationTemplateService.get_template("old_name") is None
+        assert (
+            NotificationTemplateService.get_template(
+                "old_name", channel=NotificationTemplate.Channel.EMAIL
+            )
+            is None
+        )
+        assert NotificationTemplateService.get_template("new_name") == template
+
     def test_render_template_simple(self):
         """Test rendering a template with simple variables."""
         template = NotificationTemplateFactory(
@@ -118,6 +154,21 @@ class TestNotificationTemplateService:
 
         assert result["html_body"] == "<p>Hola Maria</p>"
 
+    def test_render_template_escapes_html_values(self):
+        """Test HTML bodies escape context values."""
+        template = NotificationTemplateFactory(
+            subject="Test",
+            body="Plain text",
+            html_body="<p>Hola {{name}}</p>",
+        )
+
+        result = NotificationTemplateService.render_template(
+            template,
+            {"name": "<b>Maria</b>"},
+        )
+
+        assert result["html_body"] == "<p>Hola &lt;b&gt;Maria&lt;/b&gt;</p>"
+
     def test_render_template_without_html(self):
         """Test rendering a template without HTML body."""
         template = NotificationTemplateFactory(
@@ -148,6 +199,21 @@ class TestNotificationTemplateService:
         assert result["subject"] == "Hola Juan"
         assert "{{course}}" in result["body"]
 
+    def test_render_template_does_not_expand_values(self):
+        """Test placeholders inside context values are not rendered again."""
+        template = NotificationTemplateFactory(
+            subject="Hola {{name}}",
+            body="{{name}} - {{course}}",
+        )
+
+        result = NotificationTemplateService.render_template(
+            template,
+            {"name": "{{course}}", "course": "Seguridad"},
+        )
+
+        assert result["subject"] == "Hola {{course}}"
+        assert result["body"] == "{{course}} - Seguridad"
+
     def test_get_templates_by_channel(self):
         """Test getting all templates for a channel."""
         EmailTemplateFactory()
@@ -160,6 +226,24 @@ class TestNotificationTemplateService:
 
         assert email_templates.count() == 2
 
+    def test_get_template_cached_refreshes_after_save(self):
+        """Test that saving a template drops its cached copy."""
+        template = NotificationTemplateFactory(subject="Old subject")
+        assert NotificationTemplateService.get_template_cached(template.pk).subject == (
+            "Old subject"
+        )
+
+        template.subject = "New subject"
+        template.save()
+
+        assert NotificationTemplateService.get_template_cached(template.pk).subject == (
+            "New subject"
+        )
+
+    def test_get_template_cached_returns_none_for_nonexistent(self):
+        """Test that a missing template id returns None."""
+        assert NotificationTemplateService.get_template_cached(99999) is None
+
 
 @pytest.mark.django_db
 class TestNotificationService:
@@ -286,10 +370,10 @@ class TestNotificationService:
         call_args = mock_send_mail.call_args
         assert "<p>Hello Juan</p>" in call_args.kwargs["html_message"]
 
-    @patch("apps.notifications.services.PushService.send_push")
+    @patch("apps.notifications.services.PushService.send_push_to_subscriptions")
     def test_send_notification_push(self, mock_send_push):
         """Test sending a push notification."""
-        mock_send_push.return_value = True
+        mock_send_push.return_value = 1
         user = UserFactory()
         PushSubscriptionFactory(user=user)
         notification = NotificationFactory(
@@ -444,9 +528,7 @@ class TestNotificationService:
     def test_mark_all_as_read(self):
         """Test marking all user notifications as read."""
         user = UserFactory()
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(3, user=user)
 
         count = NotificationService.mark_all_as_read(user)
 
@@ -473,8 +555,7 @@ class TestNotificationService:
         """Test getting user notifications."""
         user = UserFactory()
         other_user = UserFactory()
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(2, user=user)
         NotificationFactory(user=other_user)
 
         notifications = NotificationService.get_user_notifications(user)
@@ -507,8 +588,7 @@ class TestNotificationService:
     def test_get_user_notifications_limit(self):
         """Test notification limit."""
         user = UserFactory()
-        for _ in range(10):
-            NotificationFactory(user=user)
+        NotificationFactory.create_bulk(10, user=user)
 
         notifications = NotificationService.get_user_notifications(user, limit=5)
 
@@ -517,8 +597,7 @@ class TestNotificationService:
     def test_get_unread_count(self):
         """Test getting unread notification count."""
         user = UserFactory()
-        NotificationFactory(user=user)
-        NotificationFactory(user=user)
+        NotificationFactory.create_bulk(2, user=user)
         NotificationFactory(user=user, read_at=timezone.now())
 
         count = NotificationService.get_unread_count(user)
@@ -574,7 +653,7 @@ class TestBulkNotificationService:
 
     def test_send_to_users(self):
         """Test sending notifications to multiple users."""
-        users = [UserFactory() for _ in range(3)]
+        users = UserFactory.create_bulk(3)
 
         notifications = BulkNotificationService.send_to_users(
             users=users,
@@ -588,7 +667,7 @@ class TestBulkNotificationService:
 
     def test_send_from_template_to_users(self):
         """Test sending template notifications to multiple users."""
-        users = [UserFactory() for _ in range(3)]
+        users = UserFactory.create_bulk(3)
         NotificationTemplateFactory(
             name="bulk_template",
             subject="Hola {{user_name}}",
@@ -832,6 +911,32 @@ class TestPushService:
         subscription.refresh_from_db()
         assert subscription.last_used_at is not None
 
+    def test_send_push_to_subscriptions(self):
+        """Test sending to several subscriptions updates each of them."""
+        user = UserFactory()
+        subscriptions = [PushSubscriptionFactory(user=user) for _ in range(3)]
+        old = timezone.now() - timedelta(days=10)
+        PushSubscription.objects.filter(user=user).update(last_used_at=old)
+        notification = NotificationFactory(user=user)
+
+        sent = PushService.send_push_to_subscriptions(subscriptions, notification)
+
+        assert sent == 3
+        assert not PushSubscription.objects.filter(user=user, last_used_at=old).exists()
+
+    @patch("apps.notifications.services.push.PushService._deliver")
+    def test_send_push_to_subscriptions_deactivates_expired(self, mock_deliver):
+        """Test expired endpoints are deactivated in bulk."""
+        mock_deliver.return_value = "expired"
+        user = UserFactory()
+        subscriptions = [PushSubscriptionFactory(user=user) for _ in range(2)]
+        notification = NotificationFactory(user=user)
+
+        sent = PushService.send_push_to_subscriptions(subscriptions, notification)
+
+        assert sent == 0
+        assert not PushSubscription.objects.filter(user=user, is_active=True).exists()
+
     def test_send_push_deactivates_on_410(self):
         """Test that 410 error deactivates subscription.
 
@@ -0,0 +1,139 @@
+"""
+Tests for notification Celery tasks.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+
+import pytest
+
+from apps.notifications.models import Notification
+from apps.notifications.services import BulkNotificationService, NotificationService
+from apps.notifications.tasks import delete_old_notifications, send_notification_task
+
+from .factories import (
+    EmailNotificationFactory,
+    NotificationFactory,
+    ReadNotificationFactory,
+    SentNotificationFactory,
+    UserFactory,
+)
+
+
+@pytest.mark.django_db
+class TestSendNotificationTask:
+    """Tests for send_notification_task."""
+
+    def test_sends_pending_notification(self):
+        """Test the task sends a pending notification."""
+        notification = NotificationFactory()
+
+        send_notification_task(notification.id)
+
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.SENT
+        assert notification.sent_at is not None
+
+    def test_skips_already_sent_notification(self):
+        """Test the task does not resend notifications that left pending."""
+        notification = SentNotificationFactory()
+
+        with patch.object(NotificationService, "send_notification") as mock_send:
+            send_notification_task(notification.id)
+
+        mock_send.assert_not_called()
+
+    def test_transient_error_retries_before_last_attempt(self):
+        """Test connection errors re-raise for retry and leave the row untouched."""
+        notification = EmailNotificationFactory()
+
+        for retries in range(send_notification_task.max_retries):
+            with (
+                patch.object(
+                    NotificationService, "_send_email", side_effect=ConnectionError("down")
+                ),
+                patch.object(
+                    send_notification_task, "retry", side_effect=lambda exc, **kwargs: exc
+                ) as mock_retry,
+                pytest.raises(ConnectionError),
+            ):
+                send_notification_task.apply(args=[notification.id], retries=retries, throw=True)
+
+            mock_retry.assert_called_once()
+            notification.refresh_from_db()
+            assert notification.status == Notification.Status.PENDING
+            assert notification.retry_count == 0
+            assert notification.error_message == ""
+
+    def test_transient_error_recorded_on_last_attempt(self):
+        """Test the last attempt marks the notification failed exactly once."""
+        notification = EmailNotificationFactory()
+
+        with (
+            patch.object(NotificationService, "_send_email", side_effect=ConnectionError("down")),
+            patch.object(send_notification_task, "retry") as mock_retry,
+        ):
+            result = send_notification_task.apply(
+                args=[notification.id],
+                retries=send_notification_task.max_retries,
+                throw=True,
+            )
+
+        assert result.successful()
+        mock_retry.assert_not_called()
+        notification.refresh_from_db()
+        assert notification.status == Notification.Status.FAILED
+        assert notification.retry_count == 1
+        assert "down" in notification.error_message
+
+    def test_create_notification_queues_send_on_commit(self, django_capture_on_commit_callbacks):
+        """Test creating a notification queues its delivery after commit."""
+        user = UserFactory()
+
+        with (
+            patch("apps.notifications.tasks.send_notification_task.delay") as mock_delay,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            notification = NotificationService.create_notification(
+                user=user,
+                subject="Test",
+                body="Body",
+            )
+
+        mock_delay.assert_called_once_with(notification.id)
+
+    def test_bulk_send_queues_delivery_on_commit(self, django_capture_on_commit_callbacks):
+        """Test bulk notifications are delivered once the transaction commits."""
+        users = UserFactory.create_bulk(3)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            notifications = BulkNotificationService.send_to_users(
+                users=users,
+                subject="Bulk",
+                body="Body",
+            )
+
+        sent = Notification.objects.filter(
+            id__in=[n.id for n in notifications],
+            status=Notification.Status.SENT,
+        )
+        assert sent.count() == 3
+
+
+@pytest.mark.django_db
+class TestDeleteOldNotificationsTask:
+    """Tests for the delete_old_notifications periodic task."""
+
+    def test_deletes_old_read_notifications(self):
+        """Test the sweep removes read notifications past the cutoff."""
+        old = ReadNotificationFactory()
+        Notification.objects.filter(pk=old.pk).update(read_at=timezone.now() - timedelta(days=120))
+        recent = ReadNotificationFactory()
+
+        deleted = delete_old_notifications(days=90)
+
+        assert deleted == 1
+        assert not Notification.objects.filter(pk=old.pk).exists()
+        assert Notification.objects.filter(pk=recent.pk).exists()